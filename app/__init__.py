@@ -1 +1,6 @@
 # Mock Interview Agent App
+
+# Must run before any module imports pydantic-based libraries (LangChain)
+from app.compat.pydantic_py312_patch import apply_patch
+
+apply_patch()
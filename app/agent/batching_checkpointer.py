@@ -0,0 +1,123 @@
+from typing import Any, Dict, List, Optional, Tuple
+import time
+
+from langchain_core.pydantic_v1 import Field
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.utils import ConfigurableFieldSpec
+from langgraph.checkpoint.base import BaseCheckpointSaver, Checkpoint
+
+
+class BatchingCheckpointSaver(BaseCheckpointSaver):
+    """
+    Checkpointer wrapper that writes every Nth checkpoint of a thread.
+
+    Each checkpoint is a full snapshot of the thread's state, so buffered
+    snapshots are simply superseded by newer ones; only the latest is kept
+    and it is written through to the inner saver once ``batch_size`` turns
+    have accumulated (or on flush). Reads are served from the buffer first.
+
+    Buffered checkpoints only reach the inner saver on the Nth turn, on
+    ``aflush()`` at shutdown or never: up to ``batch_size - 1`` turns per
+    thread are lost if the process crashes or is killed. Buffered state is
+    also visible only to this process, so use it with a single worker or
+    sticky sessions.
+
+    ``evict()`` drops a thread's buffer without writing it (call it when the
+    session is deleted or expires, see adelete_thread). Buffers idle longer
+    than ``max_idle_seconds`` are written through to the inner saver as new
+    writes come in, so sessions that expire unnoticed (e.g. by Redis TTL) do
+    not leak, while a session that is only being read (which slides its TTL
+    but not this timer) never loses its latest turn.
+    """
+
+    inner: BaseCheckpointSaver
+    batch_size: int
+    max_idle_seconds: float
+    # thread_id -> (config, checkpoint, buffered turns, last write), oldest first
+    pending: Dict[str, Tuple[Any, Checkpoint, int, float]] = Field(default_factory=dict, repr=False)
+
+    @classmethod
+    def wrap(
+        cls,
+        inner: BaseCheckpointSaver,
+        batch_size: int,
+        max_idle_seconds: float
+    ) -> "BatchingCheckpointSaver":
+        return cls(inner=inner, batch_size=batch_size, max_idle_seconds=max_idle_seconds, at=inner.at)
+
+    @property
+    def config_specs(self) -> list[ConfigurableFieldSpec]:
+        return self.inner.config_specs
+
+    @staticmethod
+    def _thread_id(config: RunnableConfig) -> str:
+        return config["configurable"]["thread_id"]
+
+    def _take_idle(self) -> List[Tuple[Any, Checkpoint]]:
+        """Remove and return buffers of threads idle for longer than max_idle_seconds."""
+        now = time.monotonic()
+        idle = []
+        while self.pending:
+            thread_id, (config, checkpoint, _, last_write) = next(iter(self.pending.items()))
+            if now - last_write <= self.max_idle_seconds:
+                break
+            del self.pending[thread_id]
+            idle.append((config, checkpoint))
+        return idle
+
+    def _buffer(self, config: RunnableConfig, checkpoint: Checkpoint) -> bool:
+        """Buffer a checkpoint. Returns True when it is due to be written."""
+        now = time.monotonic()
+        thread_id = self._thread_id(config)
+        # Popped and re-inserted so `pending` stays ordered by last write
+        _, _, count, _ = self.pending.pop(thread_id, (None, None, 0, now))
+        if count + 1 >= self.batch_size:
+            return True
+        self.pending[thread_id] = (config, checkpoint, count + 1, now)
+        return False
+
+    def evict(self, thread_id: str) -> None:
+        """Drop a thread's buffered checkpoint without writing it."""
+        self.pending.pop(thread_id, None)
+
+    def get(self, config: RunnableConfig) -> Optional[Checkpoint]:
+        buffered = self.pending.get(self._thread_id(config))
+        return buffered[1] if buffered else self.inner.get(config)
+
+    def put(self, config: RunnableConfig, checkpoint: Checkpoint) -> None:
+        for idle_config, idle_checkpoint in self._take_idle():
+            self.inner.put(idle_config, idle_checkpoint)
+        if self._buffer(config, checkpoint):
+            self.inner.put(config, checkpoint)
+
+    async def aget(self, config: RunnableConfig) -> Optional[Checkpoint]:
+        buffered = self.pending.get(self._thread_id(config))
+        return buffered[1] if buffered else await self.inner.aget(config)
+
+    async def aput(self, config: RunnableConfig, checkpoint: Checkpoint) -> None:
+        for idle_config, idle_checkpoint in self._take_idle():
+            await self.inner.aput(idle_config, idle_checkpoint)
+        if self._buffer(config, checkpoint):
+            await self.inner.aput(config, checkpoint)
+
+    async def setup(self) -> None:
+        """Set up the inner saver, if it needs it."""
+        if hasattr(self.inner, "setup"):
+            await self.inner.setup()
+
+    async def aclose(self) -> None:
+        """Close the inner saver, if it holds a connection."""
+        if hasattr(self.inner, "aclose"):
+            await self.inner.aclose()
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Drop a thread's buffered checkpoint and delete it from the inner saver."""
+        self.evict(thread_id)
+        if hasattr(self.inner, "adelete_thread"):
+            await self.inner.adelete_thread(thread_id)
+
+    async def aflush(self) -> None:
+        """Write all buffered checkpoints to the inner saver."""
+        while self.pending:
+            _, (config, checkpoint, _, _) = self.pending.popitem()
+            await self.inner.aput(config, checkpoint)
@@ -0,0 +1,89 @@
+from contextlib import closing
+from app.config import CHECKPOINT_DB, CHECKPOINT_WRITE_BATCH_SIZE, REDIS_URL, SESSION_TIMEOUT_SECONDS
+import logging
+import sqlite3
+
+logger = logging.getLogger(__name__)
+
+
+def _enable_wal(db_path: str) -> None:
+    """
+    Switch a SQLite database file to write-ahead logging.
+
+    WAL mode is persisted in the database file, so setting it once here lets
+    concurrent sessions read checkpoints while another one is being written.
+    """
+    with closing(sqlite3.connect(db_path)) as conn:
+        conn.execute("PRAGMA journal_mode=WAL")
+
+
+def create_checkpointer():
+    """
+    Create the LangGraph checkpointer used to persist interview state.
+
+    With CHECKPOINT_WRITE_BATCH_SIZE above 1, the persistent saver is wrapped
+    so only every Nth checkpoint of a thread is written; buffered turns are
+    lost on a crash (see BatchingCheckpointSaver for the durability
+    trade-off).
+
+    Returns:
+        Checkpointer instance for graph.compile()
+    """
+    from langgraph.checkpoint.memory import MemorySaver
+
+    checkpointer = _create_base_checkpointer()
+
+    if CHECKPOINT_WRITE_BATCH_SIZE > 1 and not isinstance(checkpointer, MemorySaver):
+        from app.agent.batching_checkpointer import BatchingCheckpointSaver
+
+        logger.info(f"Batching checkpoint writes every {CHECKPOINT_WRITE_BATCH_SIZE} turns")
+        return BatchingCheckpointSaver.wrap(
+            checkpointer,
+            CHECKPOINT_WRITE_BATCH_SIZE,
+            max_idle_seconds=SESSION_TIMEOUT_SECONDS
+        )
+
+    return checkpointer
+
+
+def _create_base_checkpointer():
+    """
+    Create the persistent checkpointer.
+
+    When REDIS_URL is set, checkpoints are kept in Redis next to the session
+    records so every worker sees the same interview state. Otherwise uses a
+    SQLite database (CHECKPOINT_DB) through the non-blocking
+    AsyncSqliteCheckpointSaver, so session state lives on disk instead of in
+    the server's heap and survives restarts. Falls back to the in-memory
+    MemorySaver if aiosqlite is not installed.
+
+    Returns:
+        Checkpointer instance for graph.compile()
+    """
+    if REDIS_URL:
+        try:
+            from app.agent.redis_checkpointer import AsyncRedisSaver
+        except ImportError:
+            logger.warning("REDIS_URL is set but the redis package is not installed; not using Redis checkpoints")
+        else:
+            logger.info("Using Redis checkpointer")
+            return AsyncRedisSaver.from_conn_string(REDIS_URL, ttl_seconds=SESSION_TIMEOUT_SECONDS)
+
+    try:
+        from app.agent.sqlite_checkpointer import AsyncSqliteCheckpointSaver
+    except ImportError:
+        from langgraph.checkpoint.memory import MemorySaver
+
+        logger.warning(
+            "aiosqlite is not installed; falling back to in-memory checkpoints"
+        )
+        return MemorySaver()
+
+    if CHECKPOINT_DB != ":memory:":
+        try:
+            _enable_wal(CHECKPOINT_DB)
+        except sqlite3.Error as e:
+            logger.warning(f"Could not enable WAL mode on {CHECKPOINT_DB}: {e}")
+
+    logger.info(f"Using SQLite checkpointer at {CHECKPOINT_DB}")
+    return AsyncSqliteCheckpointSaver.from_conn_string(CHECKPOINT_DB)
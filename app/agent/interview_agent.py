@@ -1,37 +1,78 @@
-#  MUST be first import
-from app.compat.pydantic_py312_patch import *  # noqa
-
-
-from langgraph.graph import StateGraph, END
-from langgraph.checkpoint.memory import MemorySaver
-from langchain_google_genai import ChatGoogleGenerativeAI
 from langchain_core.messages import HumanMessage, AIMessage, BaseMessage
+from langchain_core.output_parsers import JsonOutputParser
+from langchain_core.runnables import RunnableConfig
 from app.agent.prompts import (
+    EXPERIENCE_LEVELS,
+    INITIAL_GREETING_TEMPLATE,
     INTERVIEWER_SYSTEM_PROMPT,
     get_role_specific_prompt,
-    FEEDBACK_PROMPT
+    QUESTION_FEEDBACK_PROMPT
+)
+from app.agent.checkpointer import create_checkpointer
+from app.agent.response_cache import LRUCache
+from app.config import (
+    FEEDBACK_MAX_CONCURRENCY,
+    GOOGLE_API_KEY,
+    LLM_API_ENDPOINT,
+    LLM_TRANSPORT,
+    MAX_QUESTIONS,
+    PROMPT_CACHE_MIN_TOKENS,
+    RESPONSE_CACHE_ENABLED
 )
-from app.config import GOOGLE_API_KEY
-from app.models.schemas import InterviewRole, InterviewStage
-from typing import Dict, List, TypedDict, Annotated, Optional
-import operator
+from app.models.schemas import InterviewRole, InterviewStage, QuestionFeedback
+from typing import (
+    Annotated,
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    TypedDict,
+)
+import functools
 import logging
+import re
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
+# Async callback receiving streamed reply text
+TokenCallback = Callable[[str], Awaitable[None]]
+
+
+# Maximum number of messages retained in checkpointed state per session
+MAX_STATE_MESSAGES = 20
+
+
+def trim_add(old: List[BaseMessage], new: List[BaseMessage]) -> List[BaseMessage]:
+    """
+    Append new messages and drop the oldest beyond MAX_STATE_MESSAGES.
+    
+    Must take exactly two parameters: langgraph only treats a two-argument
+    callable as a reducer and silently falls back to last-value otherwise.
+    """
+    return (old + new)[-MAX_STATE_MESSAGES:]
+
+
+# Greeting plus one entry per question; caps questions_asked/answers_given
+MAX_HISTORY_ENTRIES = MAX_QUESTIONS + 1
+
+
+def _append(old: List[str], new: List[str]) -> List[str]:
+    """Reducer that appends the delta returned by a node, keeping the first MAX_HISTORY_ENTRIES."""
+    return [*old, *new][:MAX_HISTORY_ENTRIES]
+
 
 class InterviewState(TypedDict):
     """State schema for the interview agent."""
-    messages: Annotated[List[BaseMessage], operator.add]
+    messages: Annotated[List[BaseMessage], trim_add]
     session_id: str
     role: InterviewRole
     experience_level: str
     current_stage: InterviewStage
     question_number: int
-    questions_asked: List[str]
-    answers_given: List[str]
+    questions_asked: Annotated[List[str], _append]
+    answers_given: Annotated[List[str], _append]
     user_name: str
 
 
@@ -40,6 +81,9 @@ class InterviewState(TypedDict):
 # -------------------------
 def initialize_llm():
     """Initialize LLM with proper error handling."""
+    # Imported here so importing this module stays cheap until first use
+    from langchain_google_genai import ChatGoogleGenerativeAI
+
     if not GOOGLE_API_KEY:
         logger.error("GOOGLE_API_KEY not found in environment variables")
         raise ValueError(
@@ -53,6 +97,9 @@ def initialize_llm():
             google_api_key=GOOGLE_API_KEY,
             max_retries=3,  # Add retry logic
             request_timeout=30,  # Add timeout
+            # One long-lived channel shared by every call on this singleton client
+            transport=LLM_TRANSPORT,
+            client_options={"api_endpoint": LLM_API_ENDPOINT},
         )
         logger.info("LLM initialized successfully")
         return llm
@@ -61,27 +108,55 @@ def initialize_llm():
         raise
 
 
-llm = initialize_llm()
+@functools.lru_cache(maxsize=1)
+def get_llm():
+    """Return the shared LLM client, creating it on first use."""
+    return initialize_llm()
+
+
+# Opening greetings per (role, experience level), with the candidate name
+# left as a placeholder
+GREETING_NAME_PLACEHOLDER = "{NAME}"
+greeting_cache = LRUCache(maxsize=64)
 
 
 # -------------------------
 # HELPER FUNCTIONS
 # -------------------------
+# Interview stage by question number; anything past the end is closing
+_STAGE_LUT = (
+    InterviewStage.INTRODUCTION,
+    InterviewStage.TECHNICAL,
+    InterviewStage.TECHNICAL,
+    InterviewStage.TECHNICAL,
+    InterviewStage.BEHAVIORAL,
+    InterviewStage.BEHAVIORAL,
+    InterviewStage.BEHAVIORAL,
+    InterviewStage.CLOSING,
+    InterviewStage.CLOSING,
+)
+
+
 def determine_stage(question_number: int) -> InterviewStage:
     """Determine interview stage based on question number."""
-    if question_number == 0:
-        return InterviewStage.INTRODUCTION
-    elif question_number <= 3:
-        return InterviewStage.TECHNICAL
-    elif question_number <= 6:
-        return InterviewStage.BEHAVIORAL
-    else:
-        return InterviewStage.CLOSING
+    return _STAGE_LUT[min(question_number, len(_STAGE_LUT) - 1)]
+
 
+# Canned replies used when the LLM call fails; never cached
+EMPTY_RESPONSE_FALLBACK = "Could you please elaborate on your previous answer?"
+BLANK_RESPONSE_FALLBACK = "Thank you for sharing. Let's move to the next question."
+LLM_ERROR_FALLBACK = "I apologize for the technical difficulty. Let's continue with the interview. Could you tell me more about your background?"
+INTERVIEW_COMPLETE_REPLY = "Thank you, that concludes our interview. You can now request your feedback."
+_FALLBACK_REPLIES = frozenset({
+    EMPTY_RESPONSE_FALLBACK,
+    BLANK_RESPONSE_FALLBACK,
+    LLM_ERROR_FALLBACK,
+})
 
-def safe_llm_invoke(llm_instance, messages: List[BaseMessage]) -> AIMessage:
+
+async def safe_llm_ainvoke(llm_instance, messages: List[BaseMessage]) -> AIMessage:
     """
-    Safely invoke LLM with error handling and fallbacks.
+    Safely invoke LLM asynchronously with error handling and fallbacks.
     
     Args:
         llm_instance: The LLM instance to use
@@ -91,157 +166,449 @@ def safe_llm_invoke(llm_instance, messages: List[BaseMessage]) -> AIMessage:
         AIMessage with the response
     """
     try:
-        response = llm_instance.invoke(messages)
+        response = await llm_instance.ainvoke(messages)
 
         # Handle empty or invalid responses
         if not response or not getattr(response, "content", None):
             logger.warning("LLM returned empty response, using fallback")
-            return AIMessage(
-                content="Could you please elaborate on your previous answer?"
-            )
+            return AIMessage(content=EMPTY_RESPONSE_FALLBACK)
 
         if isinstance(response.content, str) and response.content.strip() == "":
             logger.warning("LLM returned blank content, using fallback")
-            return AIMessage(
-                content="Thank you for sharing. Let's move to the next question."
-            )
+            return AIMessage(content=BLANK_RESPONSE_FALLBACK)
 
         return response
 
     except Exception as e:
         logger.error(f"LLM invocation error: {e}")
-        return AIMessage(
-            content="I apologize for the technical difficulty. Let's continue with the interview. Could you tell me more about your background?"
-        )
+        return AIMessage(content=LLM_ERROR_FALLBACK)
 
 
-def build_initial_prompt(state: InterviewState) -> str:
-    """Build the initial prompt for the interview."""
-    role_prompt = get_role_specific_prompt(
-        state["role"].value,
-        state["experience_level"]
-    )
+async def safe_llm_astream(
+    llm_instance,
+    messages: List[BaseMessage]
+) -> AsyncIterator[str]:
+    """
+    Stream LLM output as text chunks with the same fallbacks as safe_llm_ainvoke.
+
+    Errors before the first chunk yield the fallback reply. Errors after text
+    has already been streamed are re-raised, since the partial reply cannot be
+    replaced anymore.
+
+    Args:
+        llm_instance: The LLM instance to use
+        messages: List of messages to send to the LLM
+
+    Yields:
+        Text chunks as they arrive
+    """
+    emitted = False
+    try:
+        async for chunk in llm_instance.astream(messages):
+            if isinstance(chunk.content, str) and chunk.content:
+                emitted = True
+                yield chunk.content
+    except Exception as e:
+        if emitted:
+            raise
+        logger.error(f"LLM streaming error: {e}")
+        yield LLM_ERROR_FALLBACK
+        return
+
+    if not emitted:
+        logger.warning("LLM returned empty stream, using fallback")
+        yield EMPTY_RESPONSE_FALLBACK
+
+
+async def generate_reply(
+    llm_instance,
+    messages: List[BaseMessage],
+    on_token: Optional[TokenCallback] = None
+) -> AIMessage:
+    """
+    Generate a reply, streaming chunks to on_token when a listener is attached.
+
+    Args:
+        llm_instance: The LLM instance to use
+        messages: List of messages to send to the LLM
+        on_token: Optional async callback receiving each text chunk
+
+    Returns:
+        AIMessage with the complete response
+    """
+    if on_token is None:
+        return await safe_llm_ainvoke(llm_instance, messages)
+
+    chunks = []
+    async for text in safe_llm_astream(llm_instance, messages):
+        chunks.append(text)
+        await on_token(text)
+    return AIMessage(content="".join(chunks))
+
 
-    name = state.get("user_name", "there")
+# Display names per role, computed once instead of on every turn
+ROLE_DISPLAY = {role: role.value.replace('_', ' ') for role in InterviewRole}
 
-    return f"""
-{INTERVIEWER_SYSTEM_PROMPT}
+_STATIC_PREFIX_TMPL = """{system_prompt}
 
 {role_prompt}
 
 You are conducting a mock interview.
 
-Candidate name: {name}
-Role: {state['role'].value.replace('_', ' ')}
-Experience level: {state['experience_level']}
+Role: {role}
+Experience level: {experience_level}
+Candidate name: {name}"""
+
+_DYNAMIC_SUFFIX_TMPL = """Current stage: {stage}
+Questions asked so far: {n}
+
+Continue the interview naturally. Ask one clear question at a time, provide brief feedback on answers, and guide the conversation through the interview stages."""
+
+_GREETING_INSTRUCTION = """Start with a warm, professional greeting. Briefly explain the interview structure (introduction, technical questions, behavioral questions, and closing). Then ask the candidate to introduce themselves and tell you about their background.
+
+Keep your response concise and natural."""
+
 
-Start with a warm, professional greeting. Briefly explain the interview structure (introduction, technical questions, behavioral questions, and closing). Then ask the candidate to introduce themselves and tell you about their background.
+@functools.lru_cache(maxsize=256)
+def build_static_prefix(
+    role: InterviewRole,
+    experience_level: str,
+    user_name: str
+) -> str:
+    """
+    Build the byte-stable part of the prompt shared by every turn of a session.
+
+    Nothing in here may change between turns, so the provider can reuse its
+    cached prefix. Per-turn counters belong in build_dynamic_suffix. The
+    candidate name comes last so everything before it is byte-identical for
+    all sessions with the same role and experience level.
+
+    Args:
+        role: Interview role
+        experience_level: Candidate experience level
+        user_name: Candidate name
+
+    Returns:
+        Static system prompt text
+    """
+    prefix = _STATIC_PREFIX_TMPL.format(
+        system_prompt=INTERVIEWER_SYSTEM_PROMPT,
+        role_prompt=get_role_specific_prompt(role.value, experience_level),
+        role=ROLE_DISPLAY[role],
+        experience_level=experience_level,
+        name=user_name,
+    )
+
+    # Rough estimate (~4 characters per token); logged once per cached prefix
+    estimated_tokens = len(prefix) // 4
+    if estimated_tokens < PROMPT_CACHE_MIN_TOKENS:
+        logger.info(
+            f"Static prompt prefix for {role.value}/{experience_level} is ~{estimated_tokens} tokens, "
+            f"below the {PROMPT_CACHE_MIN_TOKENS}-token minimum for provider prefix caching"
+        )
+    return prefix
 
-Keep your response concise and natural.
-""".strip()
+
+def _trusted_constructor(message_cls):
+    """Return a constructor that builds messages without pydantic validation."""
+    return getattr(message_cls, "model_construct", None) or message_cls.construct
+
+
+# Prompt-only messages are built from trusted internal strings, so skip
+# re-validating them on every turn
+_trusted_human_message = _trusted_constructor(HumanMessage)
+_trusted_ai_message = _trusted_constructor(AIMessage)
+
+
+@functools.lru_cache(maxsize=256)
+def build_prefix_message(
+    role: InterviewRole,
+    experience_level: str,
+    user_name: str
+) -> HumanMessage:
+    """Build the static prefix HumanMessage once and reuse the same object every turn."""
+    return _trusted_human_message(content=build_static_prefix(role, experience_level, user_name))
+
+
+def with_static_prefix(prefix: HumanMessage, messages: List[BaseMessage]) -> List[BaseMessage]:
+    """
+    Put the static prefix in front of a conversation as its first user turn.
+    
+    The pinned langchain-google-genai rejects a leading SystemMessage, so the
+    instructions travel as a HumanMessage. Gemini expects user and model
+    turns to alternate, so when the conversation already opens with a user
+    turn the prefix is merged into it rather than sent as a second one; the
+    prefix text still comes first either way.
+    
+    Args:
+        prefix: Message from build_prefix_message
+        messages: Conversation to send after the instructions
+        
+    Returns:
+        Messages ready for the LLM
+    """
+    if messages and isinstance(messages[0], HumanMessage):
+        return [
+            _trusted_human_message(content=f"{prefix.content}\n\n{messages[0].content}"),
+            *messages[1:],
+        ]
+    return [prefix, *messages]
+
+
+def build_dynamic_suffix(stage: InterviewStage, question_number: int) -> str:
+    """Build the per-turn interview status, sent after the conversation history."""
+    return _DYNAMIC_SUFFIX_TMPL.format(stage=stage.value, n=question_number)
+
+
+def build_initial_messages(
+    role: InterviewRole,
+    experience_level: str,
+    user_name: str
+) -> List[BaseMessage]:
+    """Build the messages that ask the LLM for the opening greeting."""
+    return with_static_prefix(
+        build_prefix_message(role, experience_level, user_name),
+        [_trusted_human_message(content=_GREETING_INSTRUCTION)],
+    )
+
+
+_SENTENCE_END_RE = re.compile(r"[.?!]")
+
+# A question sentence: starts with a capital letter and ends with "?"
+_QUESTION_RE = re.compile(r"([A-Z][^.!?\n]{10,200}\?)")
+_SENTENCE_SPLIT_RE = re.compile(r"(?<=[.?!])\s+")
+
+
+# Longest compressed interviewer stub; extract_question may join several questions
+_STUB_MAX_CHARS = 240
+
+
+def _first_sentence(content: str, max_chars: int = 120) -> str:
+    """Return the first sentence of a message, truncated to max_chars."""
+    return _SENTENCE_END_RE.split(content, maxsplit=1)[0].strip()[:max_chars]
+
+
+def extract_question(content) -> str:
+    """
+    Return the question an interviewer message asks, for questions_asked.
+    
+    Uses the question sentences when there are any, otherwise the message's
+    last sentence (or its full text), so every interviewer turn yields
+    exactly one entry and questions_asked stays aligned with answers_given.
+    """
+    text = content if isinstance(content, str) else str(content)
+    asked = _QUESTION_RE.findall(text)
+    if asked:
+        return " ".join(asked)
+    sentences = [s for s in _SENTENCE_SPLIT_RE.split(text.strip()) if s]
+    return sentences[-1] if sentences else text.strip()
+
+
+def compress_old_turns(
+    messages: List[BaseMessage],
+    keep_last: int = 4
+) -> List[BaseMessage]:
+    """
+    Keep the most recent messages verbatim and shrink older ones to stubs.
+
+    Older turns are reduced with plain string operations (no LLM call):
+    interviewer messages to the question they asked (they usually open with
+    a short acknowledgement), candidate answers to their first sentence.
+    This bounds the prompt size as the interview grows while keeping enough
+    context for follow-up questions.
+
+    Args:
+        messages: Conversation history
+        keep_last: Number of trailing messages kept verbatim
+
+    Returns:
+        History with older turns replaced by one-line stubs
+    """
+    if len(messages) <= keep_last:
+        return list(messages)
+
+    compressed: List[BaseMessage] = []
+    for message in messages[:-keep_last]:
+        content = message.content if isinstance(message.content, str) else str(message.content)
+        if isinstance(message, AIMessage):
+            compressed.append(_trusted_ai_message(content=f"[prior Q] {extract_question(content)[:_STUB_MAX_CHARS]}"))
+        else:
+            compressed.append(_trusted_human_message(content=f"[prior A] {_first_sentence(content)}"))
+
+    compressed.extend(messages[-keep_last:])
+    return compressed
+
+
+def render_greeting_template(state: InterviewState) -> str:
+    """Render the static opening greeting for a known role and experience level."""
+    return INITIAL_GREETING_TEMPLATE.format(
+        name=state.get("user_name", "there"),
+        role=ROLE_DISPLAY[state["role"]],
+        experience_level=state["experience_level"],
+    )
+
+
+async def get_initial_greeting_template(
+    role: InterviewRole,
+    experience_level: str
+) -> str:
+    """
+    Get the opening greeting for a role/level with a name placeholder.
+
+    The greeting only depends on role and experience level once the name is
+    factored out, so it is generated once per combination and reused.
+
+    Args:
+        role: Interview role
+        experience_level: Candidate experience level
+
+    Returns:
+        Greeting text containing GREETING_NAME_PLACEHOLDER
+    """
+    key = (role.value, experience_level)
+    template = greeting_cache.get(key)
+    if template is not None:
+        return template
+
+    response = await safe_llm_ainvoke(
+        get_llm(),
+        build_initial_messages(role, experience_level, GREETING_NAME_PLACEHOLDER)
+    )
+    if response.content not in _FALLBACK_REPLIES:
+        greeting_cache.set(key, response.content)
+    return response.content
 
 
 # -------------------------
 # GRAPH NODES
 # -------------------------
-def interviewer_node(state: InterviewState) -> Dict:
+async def interviewer_node(state: InterviewState, config: RunnableConfig) -> Dict:
     """
     Main interviewer node that processes user input and generates responses.
     
+    When the run config carries an ``on_token`` callback under
+    ``configurable``, the reply is streamed to it chunk by chunk while the
+    complete message is still committed to state.
+    
     Args:
         state: Current interview state
+        config: Run configuration supplied by LangGraph
         
     Returns:
         Updated state dict with new messages and metadata
     """
     try:
-        messages = list(state.get("messages", []))
+        # Read-only view of the history; nothing below mutates it
+        messages = state.get("messages") or []
+        on_token = config.get("configurable", {}).get("on_token")
         
-        # First turn - inject system instructions
+        # First turn - no conversation yet, ask for the opening greeting.
+        # System instructions are sent with each LLM call and never stored in
+        # state, so every HumanMessage in `messages` is a real candidate turn.
         if not messages:
-            initial_prompt = build_initial_prompt(state)
-            system_message = HumanMessage(content=initial_prompt)
-            messages = [system_message]
+            name = state.get("user_name", "there")
             
-            # Get initial greeting
-            response = safe_llm_invoke(llm, messages)  # type: ignore
+            # Known role/level combinations get a static greeting with no LLM
+            # call. Otherwise reuse the generated role/level template and
+            # interpolate the candidate name afterwards.
+            if state["role"] in ROLE_DISPLAY and state["experience_level"] in EXPERIENCE_LEVELS:
+                response = AIMessage(content=render_greeting_template(state))
+            elif RESPONSE_CACHE_ENABLED:
+                template = await get_initial_greeting_template(
+                    state["role"], state["experience_level"]
+                )
+                response = AIMessage(
+                    content=template.replace(GREETING_NAME_PLACEHOLDER, name)
+                )
+            else:
+                response = await safe_llm_ainvoke(
+                    get_llm(),
+                    build_initial_messages(state["role"], state["experience_level"], name)
+                )
             
             return {
                 "messages": [response],
                 "current_stage": InterviewStage.INTRODUCTION,
                 "question_number": 0,
+                "questions_asked": [extract_question(response.content)],
             }
         
-        # Subsequent turns - build conversation context
-        # Inject system context for role awareness
-        conversation_messages = []
-        
-        # Add system context at the beginning
-        system_context = f"""You are interviewing a {state['experience_level']} level candidate for a {state['role'].value.replace('_', ' ')} position. 
-Current stage: {state.get('current_stage', InterviewStage.INTRODUCTION).value}
-Questions asked so far: {state.get('question_number', 0)}
-
-Continue the interview naturally. Ask one clear question at a time, provide brief feedback on answers, and guide the conversation through the interview stages."""
+        # The interview is over once MAX_QUESTIONS questions have been
+        # answered; close it without another LLM call or question
+        if isinstance(messages[-1], HumanMessage) and state.get("question_number", 0) >= MAX_QUESTIONS:
+            if on_token is not None:
+                await on_token(INTERVIEW_COMPLETE_REPLY)
+            return {
+                "messages": [AIMessage(content=INTERVIEW_COMPLETE_REPLY)],
+                "current_stage": InterviewStage.CLOSING,
+                "question_number": state.get("question_number", 0),
+            }
         
-        conversation_messages.append(HumanMessage(content=system_context))
+        # Subsequent turns - build conversation context ordered for prefix
+        # caching: [static instructions] -> [history] -> [dynamic status + latest answer]
+        prefix_message = build_prefix_message(
+            state["role"],
+            state["experience_level"],
+            state.get("user_name", "there")
+        )
+        dynamic_suffix = build_dynamic_suffix(
+            state.get("current_stage", InterviewStage.INTRODUCTION),
+            state.get("question_number", 0)
+        )
         
-        # Add recent conversation history (last 10 messages to avoid context overflow)
-        recent_messages = messages[-10:] if len(messages) > 10 else messages
-        conversation_messages.extend(recent_messages)
+        # Keep recent turns verbatim and compress older ones to avoid context overflow
+        recent_messages = compress_old_turns(messages)
         
-        # Invoke LLM
-        response = safe_llm_invoke(llm, conversation_messages)
+        conversation_messages: List[BaseMessage] = []
+        if isinstance(recent_messages[-1], HumanMessage):
+            conversation_messages.extend(recent_messages[:-1])
+            conversation_messages.append(_trusted_human_message(
+                content=f"{dynamic_suffix}\n\nCandidate's latest answer:\n{recent_messages[-1].content}"
+            ))
+        else:
+            conversation_messages.extend(recent_messages)
+            conversation_messages.append(_trusted_human_message(content=dynamic_suffix))
+        conversation_messages = with_static_prefix(prefix_message, conversation_messages)
         
-# Update question counter only when AI asks a new question
+        # Update question counter only when AI asks a new question
         question_number = state.get("question_number", 0)
-        if len(messages) > 1 and len(messages) > 0 and isinstance(messages[-1], HumanMessage):
+        if isinstance(messages[-1], HumanMessage):
             # User just responded, so we're about to ask a new question
             question_number += 1
         
-        # Extract question if present
-        new_questions = state.get("questions_asked", [])
-        if response.content and len(response.content) > 10:
-            # Simple heuristic: if response ends with ? it's likely a question
-            if "?" in response.content:
-                new_questions = new_questions + [response.content]
+        # Invoke LLM. Replies depend on the whole conversation, so they are
+        # never cached; only the history-free greeting is (see above).
+        response = await generate_reply(get_llm(), conversation_messages, on_token)
         
+        # Exactly one entry per interviewer turn (the greeting included), so
+        # questions_asked[i] is the question answers_given[i] responds to.
+        # Only the delta is returned; the state reducer appends it.
         return {
             "messages": [response],
             "current_stage": determine_stage(question_number),
             "question_number": question_number,
-            "questions_asked": new_questions,
+            "questions_asked": [extract_question(response.content)],
         }
         
     except Exception as e:
         logger.error(f"Error in interviewer_node: {e}")
         # Return graceful error message
+        error_reply = "I apologize for the interruption. Let's continue - could you tell me more about your experience?"
         return {
-            "messages": [AIMessage(content="I apologize for the interruption. Let's continue - could you tell me more about your experience?")],
+            "messages": [AIMessage(content=error_reply)],
             "current_stage": state.get("current_stage", InterviewStage.INTRODUCTION),
             "question_number": state.get("question_number", 0),
+            "questions_asked": [extract_question(error_reply)],
         }
 
 
-# -------------------------
-# FLOW CONTROL
-# -------------------------
-def should_continue(state: InterviewState) -> str:
-    """Determine if interview should continue or end."""
-    question_number = state.get("question_number", 0)
-    
-    # End after 8 questions (1 intro + 3 technical + 3 behavioral + 1 closing)
-    if question_number >= 8:
-        logger.info(f"Interview ending at question {question_number}")
-        return "end"
-    
-    return "continue"
-
-
 # -------------------------
 # LANGGRAPH BUILD
 # -------------------------
 def create_interview_graph():
     """Create and compile the interview graph with checkpointing."""
+    from langgraph.graph import StateGraph, END
+
     graph = StateGraph(InterviewState)
     
     # Add nodes
@@ -250,32 +617,94 @@ def create_interview_graph():
     # Set entry point
     graph.set_entry_point("interviewer")
     
-    # Add conditional edges
-    graph.add_conditional_edges(
-        "interviewer",
-        should_continue,
-        {
-            "continue": "interviewer",
-            "end": END,
-        },
-    )
+    # Each run produces exactly one interviewer reply; the next run resumes
+    # from the checkpoint once the candidate has answered
+    graph.add_edge("interviewer", END)
     
-    # Compile with memory saver for state persistence
-    memory = MemorySaver()
-    compiled_graph = graph.compile(checkpointer=memory)
+    # Compile with a persistent checkpointer for state persistence
+    compiled_graph = graph.compile(checkpointer=create_checkpointer())
     
     logger.info("Interview graph compiled successfully")
     return compiled_graph
 
 
-# Create the compiled graph
-interview_agent = create_interview_graph()
+@functools.lru_cache(maxsize=1)
+def get_interview_agent():
+    """Return the shared compiled interview graph, building it on first use."""
+    return create_interview_graph()
+
+
+async def load_interview_state(config: Dict) -> Dict:
+    """
+    Read the latest checkpointed interview state for a session.
+    
+    Args:
+        config: Run config carrying the session's thread_id
+        
+    Returns:
+        State values, or an empty dict if the thread has no checkpoint
+    """
+    checkpoint = await get_interview_agent().checkpointer.aget(config)
+    return dict(checkpoint["channel_values"]) if checkpoint else {}
+
+
+async def delete_interview_state(session_id: str) -> None:
+    """
+    Drop the checkpointed interview state of a deleted or expired session.
+    
+    Args:
+        session_id: Interview session ID (the checkpoint thread_id)
+    """
+    checkpointer = get_interview_agent().checkpointer
+    if hasattr(checkpointer, "adelete_thread"):
+        await checkpointer.adelete_thread(session_id)
+    elif isinstance(getattr(checkpointer, "storage", None), dict):
+        # MemorySaver keeps checkpoints in a plain dict keyed by thread_id
+        checkpointer.storage.pop(session_id, None)
+
+
+def __getattr__(name: str):
+    """Resolve `llm` and `interview_agent` lazily on first attribute access (PEP 562)."""
+    if name == "llm":
+        return get_llm()
+    if name == "interview_agent":
+        return get_interview_agent()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
 
 
 # -------------------------
 # FEEDBACK GENERATION
 # -------------------------
-def generate_feedback(
+_feedback_parser = JsonOutputParser()
+
+
+def parse_question_feedback(result) -> Optional[QuestionFeedback]:
+    """
+    Parse one per-question LLM result into QuestionFeedback.
+
+    Args:
+        result: AIMessage from the LLM, or the exception raised for that call
+
+    Returns:
+        Parsed feedback, or None if the call failed or returned invalid JSON
+    """
+    if isinstance(result, Exception):
+        logger.error(f"Question feedback call failed: {result}")
+        return None
+
+    try:
+        return QuestionFeedback(**_feedback_parser.parse(result.content))
+    except Exception as e:
+        logger.warning(f"Could not parse question feedback: {e}")
+        return None
+
+
+def _unique(items) -> List[str]:
+    """Drop empty and duplicate strings, keeping the original order."""
+    return list(dict.fromkeys(item.strip() for item in items if item and item.strip()))
+
+
+async def generate_feedback(
     answers: List[str],
     questions: List[str],
     role: InterviewRole,
@@ -304,70 +733,53 @@ def generate_feedback(
         }
 
     try:
-        # Create interview summary
-        interview_summary = "\n\n".join(
-            f"Q{i+1}: {q}\nA{i+1}: {a}" 
+        # Score each question/answer pair with its own prompt so the
+        # requests run concurrently instead of as one monolithic call
+        per_question_prompts = [
+            QUESTION_FEEDBACK_PROMPT.format(
+                role=ROLE_DISPLAY[role],
+                experience_level=experience_level,
+                question_number=i + 1,
+                question=q,
+                answer=a,
+            )
             for i, (q, a) in enumerate(zip(questions, answers))
+        ]
+
+        results = await get_llm().abatch(
+            per_question_prompts,
+            config={"max_concurrency": FEEDBACK_MAX_CONCURRENCY},
+            return_exceptions=True,
         )
+        per_question_feedback = [
+            feedback for feedback in map(parse_question_feedback, results)
+            if feedback is not None
+        ]
 
-        feedback_prompt = f"""
-{FEEDBACK_PROMPT}
-
-Interview Details:
-Role: {role.value.replace('_', ' ')}
-Experience Level: {experience_level}
-Number of Questions: {len(questions)}
-
-Interview Transcript:
-{interview_summary}
-
-Provide detailed, constructive feedback in the following format:
-
-1. Overall Score (0-100): [number]
-2. Key Strengths (2-3 points):
-   - [strength 1]
-   - [strength 2]
-   
-3. Areas for Improvement (2-3 points):
-   - [area 1]
-   - [area 2]
-   
-4. Detailed Analysis:
-   [Provide specific analysis of technical knowledge, communication, problem-solving]
-   
-5. Recommendations (2-3 actionable items):
-   - [recommendation 1]
-   - [recommendation 2]
-""".strip()
-
-        response = safe_llm_invoke(llm, [HumanMessage(content=feedback_prompt)])
-        
-        # Parse the response (basic parsing, can be improved with structured output)
-        feedback_text = response.content
+        if not per_question_feedback:
+            raise ValueError("No per-question feedback could be parsed")
+
+        overall_score = round(
+            sum(f.score for f in per_question_feedback) / len(per_question_feedback)
+        )
+
+        feedback_text = "\n\n".join(
+            f"Q{i+1} ({f.score:.0f}/100): {f.analysis}"
+            for i, f in enumerate(per_question_feedback)
+        )
         
-        # For now, return structured feedback with parsed content
-        # In production, consider using structured output or JSON mode
         return {
-            "overall_score": 75,  # Default, parse from response in production
-            "strengths": [
-                "Clear communication skills demonstrated",
-                "Good understanding of fundamental concepts",
-            ],
-            "areas_for_improvement": [
-                "Provide more specific examples from experience",
-                "Elaborate on technical problem-solving approaches",
-            ],
+            "overall_score": overall_score,
+            "strengths": _unique(f.strength for f in per_question_feedback)[:3],
+            "areas_for_improvement": _unique(f.improvement for f in per_question_feedback)[:3],
             "detailed_feedback": {
                 "summary": feedback_text,
+                "per_question": [f.model_dump() for f in per_question_feedback],
                 "role": role.value,
                 "experience_level": experience_level,
                 "questions_answered": len(answers),
             },
-            "recommendations": [
-                "Practice using the STAR method (Situation, Task, Action, Result) for behavioral questions",
-                "Review core technical concepts relevant to the role",
-                "Prepare specific examples from past projects",
-            ],
+            "recommendations": _unique(f.recommendation for f in per_question_feedback)[:3],
         }
         
     except Exception as e:
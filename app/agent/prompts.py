@@ -22,77 +22,85 @@ Guidelines:
 - If an answer is incomplete, ask clarifying questions
 """
 
-def get_role_specific_prompt(role: str, experience_level: str) -> str:
-    """Generate role-specific interview prompts."""
-    
-    role_questions = {
-        "software_engineer": {
-            "junior": [
-                "What programming languages are you most comfortable with?",
-                "Can you explain the difference between a list and an array?",
-                "What is version control, and why is it important?",
-                "Describe a project you've worked on. What was your role?",
-            ],
-            "mid": [
-                "Explain the difference between REST and GraphQL APIs.",
-                "How do you approach debugging a complex issue?",
-                "Describe a time you had to refactor legacy code.",
-                "What design patterns have you used in your projects?",
-            ],
-            "senior": [
-                "How would you design a scalable microservices architecture?",
-                "Describe your approach to code review and mentoring.",
-                "How do you handle technical debt in a fast-moving team?",
-                "Explain a challenging system design problem you solved.",
-            ]
-        },
-        "data_scientist": {
-            "junior": [
-                "What is the difference between supervised and unsupervised learning?",
-                "How do you handle missing data in a dataset?",
-                "Explain what overfitting means.",
-                "What tools and libraries do you use for data analysis?",
-            ],
-            "mid": [
-                "How would you evaluate a machine learning model?",
-                "Explain cross-validation and why it's important.",
-                "Describe a time you had to deal with imbalanced data.",
-                "How do you approach feature engineering?",
-            ],
-            "senior": [
-                "How would you design an ML system for production?",
-                "Explain your approach to A/B testing and experimentation.",
-                "How do you ensure model fairness and bias mitigation?",
-                "Describe a complex data pipeline you've designed.",
-            ]
-        },
-        "product_manager": {
-            "junior": [
-                "What is the role of a product manager?",
-                "How do you prioritize features?",
-                "Describe a product you use daily and what you'd improve.",
-                "How do you gather user requirements?",
-            ],
-            "mid": [
-                "How do you balance user needs with business goals?",
-                "Describe a time you had to say no to a feature request.",
-                "How do you measure product success?",
-                "Explain your approach to roadmap planning.",
-            ],
-            "senior": [
-                "How do you align product strategy with company vision?",
-                "Describe a time you led a product pivot.",
-                "How do you handle competing stakeholder interests?",
-                "Explain your approach to building product teams.",
-            ]
-        }
+EXPERIENCE_LEVELS = ("junior", "mid", "senior")
+
+INITIAL_GREETING_TEMPLATE = """Hello {name}, and welcome to your mock interview for the {role} position! I'll be your interviewer today.
+
+We'll go through four stages: a short introduction, a few technical questions, some behavioral questions about your past experience, and a closing section where you can ask me anything. Since this is a {experience_level}-level interview, I'll tailor the questions to that experience level.
+
+To get started, could you please introduce yourself and tell me a bit about your background?"""
+
+ROLE_QUESTIONS = {
+    "software_engineer": {
+        "junior": [
+            "What programming languages are you most comfortable with?",
+            "Can you explain the difference between a list and an array?",
+            "What is version control, and why is it important?",
+            "Describe a project you've worked on. What was your role?",
+        ],
+        "mid": [
+            "Explain the difference between REST and GraphQL APIs.",
+            "How do you approach debugging a complex issue?",
+            "Describe a time you had to refactor legacy code.",
+            "What design patterns have you used in your projects?",
+        ],
+        "senior": [
+            "How would you design a scalable microservices architecture?",
+            "Describe your approach to code review and mentoring.",
+            "How do you handle technical debt in a fast-moving team?",
+            "Explain a challenging system design problem you solved.",
+        ]
+    },
+    "data_scientist": {
+        "junior": [
+            "What is the difference between supervised and unsupervised learning?",
+            "How do you handle missing data in a dataset?",
+            "Explain what overfitting means.",
+            "What tools and libraries do you use for data analysis?",
+        ],
+        "mid": [
+            "How would you evaluate a machine learning model?",
+            "Explain cross-validation and why it's important.",
+            "Describe a time you had to deal with imbalanced data.",
+            "How do you approach feature engineering?",
+        ],
+        "senior": [
+            "How would you design an ML system for production?",
+            "Explain your approach to A/B testing and experimentation.",
+            "How do you ensure model fairness and bias mitigation?",
+            "Describe a complex data pipeline you've designed.",
+        ]
+    },
+    "product_manager": {
+        "junior": [
+            "What is the role of a product manager?",
+            "How do you prioritize features?",
+            "Describe a product you use daily and what you'd improve.",
+            "How do you gather user requirements?",
+        ],
+        "mid": [
+            "How do you balance user needs with business goals?",
+            "Describe a time you had to say no to a feature request.",
+            "How do you measure product success?",
+            "Explain your approach to roadmap planning.",
+        ],
+        "senior": [
+            "How do you align product strategy with company vision?",
+            "Describe a time you led a product pivot.",
+            "How do you handle competing stakeholder interests?",
+            "Explain your approach to building product teams.",
+        ]
     }
-    
-    questions = role_questions.get(role, {}).get(experience_level, [])
+}
+
+
+def _build_role_prompt(role: str, experience_level: str) -> str:
+    """Render the role-specific interview prompt."""
+    questions = ROLE_QUESTIONS.get(role, {}).get(experience_level, [])
     
     # Fallback questions for general role or missing role/experience
     if not questions:
-        questions = role_questions.get("software_engineer", {}).get(experience_level, [
+        questions = ROLE_QUESTIONS.get("software_engineer", {}).get(experience_level, [
             "Tell me about yourself and your background.",
             "What interests you about this role?",
             "Describe a challenge you've faced and how you overcame it.",
@@ -118,20 +126,40 @@ Remember to:
 - Ask follow-up questions when needed
 """
 
-FEEDBACK_PROMPT = """Analyze the candidate's interview performance and provide constructive feedback.
 
-Consider:
-1. Communication clarity and structure
-2. Technical knowledge demonstrated
-3. Problem-solving approach
-4. Examples and specific details provided
-5. Areas that need improvement
+# Every known role/level prompt rendered once at import
+ROLE_PROMPT_CACHE = {
+    (role, level): _build_role_prompt(role, level)
+    for role in (*ROLE_QUESTIONS, "general")
+    for level in EXPERIENCE_LEVELS
+}
+
+
+def get_role_specific_prompt(role: str, experience_level: str) -> str:
+    """Generate role-specific interview prompts."""
+    prompt = ROLE_PROMPT_CACHE.get((role, experience_level))
+    if prompt is None:
+        prompt = _build_role_prompt(role, experience_level)
+    return prompt
+
+
+QUESTION_FEEDBACK_PROMPT = """Analyze one answer from a mock interview and provide constructive feedback.
+
+Role: {role}
+Experience Level: {experience_level}
+
+Question {question_number}: {question}
+Answer: {answer}
+
+Consider communication clarity, technical knowledge, problem-solving approach, and the use of specific examples.
 
-Provide:
-- Overall score (0-100)
-- 2-3 key strengths
-- 2-3 areas for improvement
-- Specific recommendations
-- Encouraging tone
+Respond with only a JSON object with these keys:
+{{
+  "score": <number from 0 to 100>,
+  "strength": "<one key strength>",
+  "improvement": "<one area for improvement>",
+  "recommendation": "<one specific, actionable recommendation>",
+  "analysis": "<two or three sentences of analysis>"
+}}
 
-Be specific and actionable in your feedback."""
+Keep the feedback concise, specific, and encouraging."""
@@ -0,0 +1,75 @@
+from typing import Any, Optional
+import pickle
+
+import redis
+import redis.asyncio as aioredis
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.utils import ConfigurableFieldSpec
+from langgraph.checkpoint.base import BaseCheckpointSaver, Checkpoint
+
+from app.storage.session_store import CHECKPOINT_KEY_PREFIX
+
+
+class AsyncRedisSaver(BaseCheckpointSaver):
+    """
+    LangGraph checkpointer that keeps each thread's checkpoint in Redis.
+
+    The checkpoint for a thread is a pickled payload under ``ckpt:<thread_id>``
+    with the session timeout as its TTL, so interview state is shared by all
+    workers and expires together with the session instead of being copied
+    into the session record on every turn. RedisSessionStore slides this TTL
+    whenever it slides the session's, so an idle-but-alive session never
+    loses its checkpoint.
+    """
+
+    client: Any
+    sync_client: Any
+    ttl_seconds: int
+
+    @classmethod
+    def from_conn_string(cls, conn_string: str, ttl_seconds: int) -> "AsyncRedisSaver":
+        return cls(
+            client=aioredis.Redis.from_url(conn_string),
+            sync_client=redis.Redis.from_url(conn_string),
+            ttl_seconds=ttl_seconds,
+        )
+
+    @property
+    def config_specs(self) -> list[ConfigurableFieldSpec]:
+        return [
+            ConfigurableFieldSpec(
+                id="thread_id",
+                annotation=str,
+                name="Thread ID",
+                description=None,
+                default="",
+                is_shared=True,
+            ),
+        ]
+
+    @staticmethod
+    def _key(config: RunnableConfig) -> str:
+        return f"{CHECKPOINT_KEY_PREFIX}{config['configurable']['thread_id']}"
+
+    def get(self, config: RunnableConfig) -> Optional[Checkpoint]:
+        payload = self.sync_client.get(self._key(config))
+        return pickle.loads(payload) if payload is not None else None
+
+    def put(self, config: RunnableConfig, checkpoint: Checkpoint) -> None:
+        self.sync_client.set(self._key(config), pickle.dumps(checkpoint), ex=self.ttl_seconds)
+
+    async def aget(self, config: RunnableConfig) -> Optional[Checkpoint]:
+        payload = await self.client.get(self._key(config))
+        return pickle.loads(payload) if payload is not None else None
+
+    async def aput(self, config: RunnableConfig, checkpoint: Checkpoint) -> None:
+        await self.client.set(self._key(config), pickle.dumps(checkpoint), ex=self.ttl_seconds)
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Delete the stored checkpoint of a thread."""
+        await self.client.delete(f"{CHECKPOINT_KEY_PREFIX}{thread_id}")
+
+    async def aclose(self) -> None:
+        """Close both Redis connection pools."""
+        await self.client.aclose()
+        self.sync_client.close()
@@ -0,0 +1,109 @@
+from contextlib import closing
+from typing import Any, Optional
+import asyncio
+import pickle
+import sqlite3
+
+import aiosqlite
+from langchain_core.pydantic_v1 import Field
+from langchain_core.runnables import RunnableConfig
+from langchain_core.runnables.utils import ConfigurableFieldSpec
+from langgraph.checkpoint.base import BaseCheckpointSaver, Checkpoint
+
+# Same layout as langgraph's own SQLite savers, so existing databases keep working
+_CREATE_TABLE = "CREATE TABLE IF NOT EXISTS checkpoints (thread_id TEXT PRIMARY KEY, checkpoint BLOB)"
+_SELECT = "SELECT checkpoint FROM checkpoints WHERE thread_id = ?"
+_UPSERT = "INSERT OR REPLACE INTO checkpoints (thread_id, checkpoint) VALUES (?, ?)"
+_DELETE = "DELETE FROM checkpoints WHERE thread_id = ?"
+
+
+class AsyncSqliteCheckpointSaver(BaseCheckpointSaver):
+    """
+    LangGraph checkpointer that keeps each thread's checkpoint in SQLite.
+
+    Replaces the AsyncSqliteSaver bundled with the pinned langgraph, whose
+    lazy setup races under concurrent first requests, prints to stdout on
+    every call and never closes its connection. The aiosqlite connection is
+    opened once under a lock (call ``setup()`` at startup), closed with
+    ``aclose()``, and a thread's checkpoint can be dropped with
+    ``adelete_thread()`` when its session goes away.
+
+    The sync ``get``/``put`` use a short-lived sqlite3 connection; with
+    ``:memory:`` they see a different database than the async methods.
+    """
+
+    db_path: str
+    conn: Any = Field(default=None, repr=False)
+    setup_lock: Any = Field(default_factory=asyncio.Lock, repr=False)
+
+    @classmethod
+    def from_conn_string(cls, db_path: str) -> "AsyncSqliteCheckpointSaver":
+        return cls(db_path=db_path)
+
+    @property
+    def config_specs(self) -> list[ConfigurableFieldSpec]:
+        return [
+            ConfigurableFieldSpec(
+                id="thread_id",
+                annotation=str,
+                name="Thread ID",
+                description=None,
+                default="",
+                is_shared=True,
+            ),
+        ]
+
+    @staticmethod
+    def _thread_id(config: RunnableConfig) -> str:
+        return config["configurable"]["thread_id"]
+
+    async def setup(self) -> None:
+        """Open the connection and create the table, once."""
+        async with self.setup_lock:
+            if self.conn is not None:
+                return
+            conn = await aiosqlite.connect(self.db_path)
+            await conn.execute(_CREATE_TABLE)
+            await conn.commit()
+            self.conn = conn
+
+    async def _connection(self) -> "aiosqlite.Connection":
+        if self.conn is None:
+            await self.setup()
+        return self.conn
+
+    async def aclose(self) -> None:
+        """Close the connection so the aiosqlite worker thread exits."""
+        async with self.setup_lock:
+            if self.conn is not None:
+                await self.conn.close()
+                self.conn = None
+
+    def get(self, config: RunnableConfig) -> Optional[Checkpoint]:
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            conn.execute(_CREATE_TABLE)
+            row = conn.execute(_SELECT, (self._thread_id(config),)).fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    def put(self, config: RunnableConfig, checkpoint: Checkpoint) -> None:
+        with closing(sqlite3.connect(self.db_path)) as conn:
+            conn.execute(_CREATE_TABLE)
+            conn.execute(_UPSERT, (self._thread_id(config), pickle.dumps(checkpoint)))
+            conn.commit()
+
+    async def aget(self, config: RunnableConfig) -> Optional[Checkpoint]:
+        conn = await self._connection()
+        async with conn.execute(_SELECT, (self._thread_id(config),)) as cursor:
+            row = await cursor.fetchone()
+        return pickle.loads(row[0]) if row else None
+
+    async def aput(self, config: RunnableConfig, checkpoint: Checkpoint) -> None:
+        conn = await self._connection()
+        await conn.execute(_UPSERT, (self._thread_id(config), pickle.dumps(checkpoint)))
+        await conn.commit()
+
+    async def adelete_thread(self, thread_id: str) -> None:
+        """Delete the stored checkpoint of a thread."""
+        conn = await self._connection()
+        await conn.execute(_DELETE, (thread_id,))
+        await conn.commit()
@@ -1,7 +1,4 @@
-#  MUST be first import
-from app.compat.pydantic_py312_patch import *  # noqa
-
-from fastapi import APIRouter, HTTPException, UploadFile, File
+from fastapi import APIRouter, HTTPException
 from fastapi.responses import Response, StreamingResponse
 from app.models.schemas import (
     InterviewRequest,
@@ -11,51 +8,137 @@ from app.models.schemas import (
     InterviewSession
 )
 from pydantic import BaseModel
-from app.agent.interview_agent import interview_agent, generate_feedback
-from app.voice.speech_handler import speech_handler
-from app.models.schemas import InterviewStage
-from langchain_core.messages import HumanMessage
+from app.config import API_V1_PREFIX
+from app.storage.session_store import AUDIO_PENDING, session_store
+from app.models.schemas import SCHEMA_CONFIG, InterviewStage
+import asyncio
 import uuid
 import json
-import base64
-from typing import Dict
-import io
 import logging
 from datetime import datetime
+from typing import Dict, Optional, Tuple
 
-# Configure logging
-logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
 router = APIRouter()
 
-# In-memory session storage
-# PRODUCTION NOTE: Replace with Redis, PostgreSQL, or other persistent storage
-sessions: Dict[str, Dict] = {}
+# Stage reported before the graph has recorded one
+_DEFAULT_STAGE = InterviewStage.INTRODUCTION
+
+
+def _last_reply_text(result: Dict) -> str:
+    """Text of the interviewer's latest message in a graph result."""
+    messages = result.get("messages")
+    if messages and hasattr(messages[-1], "content"):
+        return messages[-1].content
+    return "Let's continue with the interview."
+
+
+# ---------------------------------------------------------------------------
+# Audio helpers (blocking work runs in the default thread pool)
+# ---------------------------------------------------------------------------
+
+def _audio_url(session_id: str, turn_id: str) -> str:
+    return f"{API_V1_PREFIX}/interview/{session_id}/audio/{turn_id}"
+
+
+# Audio this worker is still synthesizing in the background, by
+# (session_id, turn_id). Other workers only see the AUDIO_PENDING marker in
+# the shared session store and poll it until the audio is saved.
+_pending_audio: Dict[Tuple[str, str], asyncio.Task] = {}
+
+# How often and for how long a request for pending audio synthesized by
+# another worker re-checks the session store
+AUDIO_POLL_INTERVAL_SECONDS = 0.2
+AUDIO_WAIT_TIMEOUT_SECONDS = 30
+
+
+def _speak(text: str) -> bytes:
+    """Synthesize text on a worker thread, building the speech handler there if needed."""
+    from app.voice.speech_handler import get_speech_handler
+    
+    return get_speech_handler().text_to_speech(text)
+
+
+def _tts_available() -> bool:
+    """Whether TTS works, checked on a worker thread since the first call loads the engine."""
+    from app.voice.speech_handler import get_speech_handler
+    
+    return get_speech_handler().tts_available
+
+
+async def _render_turn_audio(session_id: str, turn_id: str, text: str) -> Optional[bytes]:
+    """
+    Synthesize speech for an interviewer reply and store it for download.
+    
+    The WAV bytes are kept in the session store for AUDIO_TTL_SECONDS and
+    served by the audio endpoint, instead of being inlined as a base64 data
+    URL in the JSON response.
+    
+    Args:
+        session_id: Interview session ID
+        turn_id: Identifier of the reply within the session
+        text: Interviewer reply to speak
+        
+    Returns:
+        WAV bytes, or None if TTS produced nothing
+    """
+    audio_bytes = await asyncio.get_running_loop().run_in_executor(None, _speak, text)
+    if not audio_bytes:
+        await session_store.discard_audio(session_id, turn_id)
+        return None
+    
+    await session_store.save_audio(session_id, turn_id, audio_bytes)
+    return audio_bytes
+
 
-# Session timeout in seconds (30 minutes)
-SESSION_TIMEOUT = 1800
+async def _synthesize_audio_url(session_id: str, text: str) -> Optional[str]:
+    """Synthesize a reply's audio now and return its URL, or None if TTS produced nothing."""
+    turn_id = uuid.uuid4().hex
+    if await _render_turn_audio(session_id, turn_id, text) is None:
+        return None
+    return _audio_url(session_id, turn_id)
 
 
-def cleanup_expired_sessions():
-    """Remove expired sessions from memory."""
-    current_time = datetime.now()
-    expired_sessions = []
+async def _schedule_audio_url(session_id: str, text: str) -> Optional[str]:
+    """
+    Start synthesizing a reply's audio in the background and return its URL.
+    
+    The response is sent without waiting for TTS. The turn is marked
+    AUDIO_PENDING in the session store first, so a request for the URL on
+    any worker is held until the audio has been saved (see get_turn_audio).
+    
+    Args:
+        session_id: Interview session ID
+        text: Interviewer reply to speak
+        
+    Returns:
+        URL the audio will be served at, or None if TTS is not available
+    """
+    loop = asyncio.get_running_loop()
+    if not await loop.run_in_executor(None, _tts_available):
+        return None
     
-    for session_id, session_data in sessions.items():
-        last_activity = session_data.get("last_activity")
-        if last_activity:
-            time_diff = (current_time - last_activity).total_seconds()
-            if time_diff > SESSION_TIMEOUT:
-                expired_sessions.append(session_id)
+    turn_id = uuid.uuid4().hex
+    key = (session_id, turn_id)
+    await session_store.save_audio(session_id, turn_id, AUDIO_PENDING)
     
-    for session_id in expired_sessions:
-        del sessions[session_id]
-        logger.info(f"Cleaned up expired session: {session_id}")
+    async def render():
+        try:
+            return await _render_turn_audio(session_id, turn_id, text)
+        except Exception as e:
+            logger.warning(f"Background TTS error: {e}")
+            await session_store.discard_audio(session_id, turn_id)
+            return None
+    
+    task = asyncio.create_task(render())
+    _pending_audio[key] = task
+    task.add_done_callback(lambda _: _pending_audio.pop(key, None))
+    return _audio_url(session_id, turn_id)
 
 
 @router.post("/interview/start", response_model=InterviewSession)
-def start_interview(request: InterviewRequest):
+async def start_interview(request: InterviewRequest):
     """
     Start a new interview session.
     
@@ -66,8 +149,7 @@ def start_interview(request: InterviewRequest):
         New interview session with session_id
     """
     try:
-        # Clean up expired sessions periodically
-        cleanup_expired_sessions()
+        from app.agent.interview_agent import get_interview_agent
         
         session_id = str(uuid.uuid4())
         logger.info(f"Starting new interview session: {session_id}")
@@ -77,7 +159,7 @@ def start_interview(request: InterviewRequest):
             "session_id": session_id,
             "role": request.role,
             "experience_level": request.experience_level,
-            "current_stage": InterviewStage.INTRODUCTION,
+            "current_stage": _DEFAULT_STAGE,
             "question_number": 0,
             "questions_asked": [],
             "answers_given": [],
@@ -88,17 +170,19 @@ def start_interview(request: InterviewRequest):
         config = {"configurable": {"thread_id": session_id}}
         
         # Run initial interview node
-        result = interview_agent.invoke(initial_state, config)
+        result = await get_interview_agent().ainvoke(initial_state, config)
         
-        # Store session
-        sessions[session_id] = {
-            "state": result,
+        # Store session metadata (expires after SESSION_TIMEOUT_SECONDS of
+        # inactivity); the interview state itself lives in the checkpointer
+        start_time = datetime.now().isoformat()
+        await session_store.save(session_id, {
             "role": request.role,
             "experience_level": request.experience_level,
-            "start_time": datetime.now().isoformat(),
-            "last_activity": datetime.now(),
-            "config": config
-        }
+            "start_time": start_time,
+            "config": config,
+            "current_stage": result.get("current_stage", _DEFAULT_STAGE),
+            "question_number": result.get("question_number", 0)
+        })
         
         logger.info(f"Interview session {session_id} started successfully")
         
@@ -108,8 +192,8 @@ def start_interview(request: InterviewRequest):
             "experience_level": request.experience_level,
             "questions_asked": [],
             "answers_given": [],
-            "current_stage": InterviewStage.INTRODUCTION,
-            "start_time": sessions[session_id]["start_time"],
+            "current_stage": _DEFAULT_STAGE,
+            "start_time": start_time,
             "end_time": None
         }
         
@@ -133,20 +217,27 @@ async def process_voice_message(request: VoiceMessageRequest):
         Interview response with text and audio
     """
     try:
-        if request.session_id not in sessions:
+        from app.agent.interview_agent import get_interview_agent
+        from app.voice.speech_handler import get_speech_handler
+        from langchain_core.messages import HumanMessage
+        
+        session = await session_store.get(request.session_id)
+        if session is None:
             raise HTTPException(status_code=404, detail="Session not found or expired")
         
-        session = sessions[request.session_id]
-        session["last_activity"] = datetime.now()  # Update activity timestamp
-        state = session["state"]
         config = session["config"]
         
         logger.info(f"Processing voice message for session {request.session_id}")
         
-        # Decode and transcribe audio
+        loop = asyncio.get_running_loop()
+        
+        # Decode in a worker thread, then transcribe on the bounded Whisper pool
         try:
-            audio_bytes = speech_handler.decode_base64_audio(request.audio_data)
-            user_text = speech_handler.speech_to_text(audio_bytes)
+            speech_handler = await loop.run_in_executor(None, get_speech_handler)
+            audio_bytes = await loop.run_in_executor(
+                None, speech_handler.decode_base64_audio, request.audio_data
+            )
+            user_text = await speech_handler.speech_to_text_async(audio_bytes)
         except Exception as e:
             logger.error(f"Audio processing error: {e}")
             raise HTTPException(
@@ -165,47 +256,41 @@ async def process_voice_message(request: VoiceMessageRequest):
         # Add user message to state
         user_message = HumanMessage(content=user_text)
         
-        # Update state with user message
-        updated_state = {
-            **state,
-            "messages": state.get("messages", []) + [user_message],
-            "answers_given": state.get("answers_given", []) + [user_text]
+        # Send only this turn's delta; the checkpointer restores the rest of
+        # the state for this thread_id and the reducers append to it
+        turn_input = {
+            "messages": [user_message],
+            "answers_given": [user_text],
         }
         
         # Get interviewer response using LangGraph
-        result = interview_agent.invoke(updated_state, config)
+        result = await get_interview_agent().ainvoke(turn_input, config)
         
         # Extract interviewer's response
-        messages = result.get("messages", [])
-        last_message = messages[-1] if messages else None
-        interviewer_text = (
-            last_message.content 
-            if hasattr(last_message, 'content') 
-            else "Let's continue with the interview."
-        )
+        interviewer_text = _last_reply_text(result)
         
         logger.info(f"Interviewer response: {interviewer_text[:100]}...")
         
         # Generate audio response
         try:
-            audio_bytes = speech_handler.text_to_speech(interviewer_text)
-            audio_url = (
-                f"data:audio/wav;base64,{base64.b64encode(audio_bytes).decode()}" 
-                if audio_bytes else None
-            )
+            audio_url = await _synthesize_audio_url(request.session_id, interviewer_text)
         except Exception as e:
             logger.warning(f"TTS error: {e}")
             audio_url = None
         
-        # Update session with new state
-        sessions[request.session_id]["state"] = result
+        # Record turn progress; the full state is already checkpointed
+        current_stage = result.get("current_stage", _DEFAULT_STAGE)
+        question_number = result.get("question_number", 0)
+        session["current_stage"] = current_stage
+        session["question_number"] = question_number
+        await session_store.save(request.session_id, session)
         
         return {
             "text_response": interviewer_text,
             "audio_url": audio_url,
             "session_id": request.session_id,
-            "current_stage": result.get("current_stage", InterviewStage.INTRODUCTION),
-            "question_number": result.get("question_number", 0),
+            "current_stage": current_stage,
+            "question_number": question_number,
             "feedback": None
         }
         
@@ -221,12 +306,14 @@ async def process_voice_message(request: VoiceMessageRequest):
 
 class TextMessageRequest(BaseModel):
     """Request model for text-based interview messages."""
+    model_config = SCHEMA_CONFIG
+    
     session_id: str
     message: str
 
 
 @router.post("/interview/text", response_model=InterviewResponse)
-def process_text_message(request: TextMessageRequest):
+async def process_text_message(request: TextMessageRequest):
     """
     Process text input (fallback if voice not available).
     
@@ -237,12 +324,13 @@ def process_text_message(request: TextMessageRequest):
         Interview response with text and optional audio
     """
     try:
-        if request.session_id not in sessions:
+        from app.agent.interview_agent import get_interview_agent
+        from langchain_core.messages import HumanMessage
+        
+        session = await session_store.get(request.session_id)
+        if session is None:
             raise HTTPException(status_code=404, detail="Session not found or expired")
         
-        session = sessions[request.session_id]
-        session["last_activity"] = datetime.now()  # Update activity timestamp
-        state = session["state"]
         config = session["config"]
         
         logger.info(f"Processing text message for session {request.session_id}")
@@ -254,44 +342,38 @@ def process_text_message(request: TextMessageRequest):
         # Add user message
         user_message = HumanMessage(content=request.message)
         
-        updated_state = {
-            **state,
-            "messages": state.get("messages", []) + [user_message],
-            "answers_given": state.get("answers_given", []) + [request.message]
+        # Send only this turn's delta; the checkpointer restores the rest of
+        # the state for this thread_id and the reducers append to it
+        turn_input = {
+            "messages": [user_message],
+            "answers_given": [request.message],
         }
         
         # Get interviewer response using LangGraph
-        result = interview_agent.invoke(updated_state, config)
+        result = await get_interview_agent().ainvoke(turn_input, config)
         
         # Extract interviewer's response
-        messages = result.get("messages", [])
-        last_message = messages[-1] if messages else None
-        interviewer_text = (
-            last_message.content 
-            if hasattr(last_message, 'content') 
-            else "Let's continue with the interview."
-        )
+        interviewer_text = _last_reply_text(result)
         
         logger.info(f"Interviewer response: {interviewer_text[:100]}...")
         
-        # Generate audio (optional for text mode)
-        audio_url = None
-        try:
-            audio_bytes = speech_handler.text_to_speech(interviewer_text)
-            if audio_bytes:
-                audio_url = f"data:audio/wav;base64,{base64.b64encode(audio_bytes).decode()}"
-        except Exception as e:
-            logger.warning(f"TTS error (optional): {e}")
+        # Generate audio in the background (optional for text mode) so the
+        # text reply is not held up by TTS
+        audio_url = await _schedule_audio_url(request.session_id, interviewer_text)
         
-        # Update session
-        sessions[request.session_id]["state"] = result
+        # Record turn progress; the full state is already checkpointed
+        current_stage = result.get("current_stage", _DEFAULT_STAGE)
+        question_number = result.get("question_number", 0)
+        session["current_stage"] = current_stage
+        session["question_number"] = question_number
+        await session_store.save(request.session_id, session)
         
         return {
             "text_response": interviewer_text,
             "audio_url": audio_url,
             "session_id": request.session_id,
-            "current_stage": result.get("current_stage", InterviewStage.INTRODUCTION),
-            "question_number": result.get("question_number", 0),
+            "current_stage": current_stage,
+            "question_number": question_number,
             "feedback": None
         }
         
@@ -305,8 +387,128 @@ def process_text_message(request: TextMessageRequest):
         )
 
 
+@router.post("/interview/text/stream")
+async def stream_text_message(request: TextMessageRequest):
+    """
+    Process text input and stream the interviewer's reply as server-sent events.
+    
+    Each chunk of the reply is sent as a ``data: {"token": ...}`` event as soon
+    as the LLM produces it. A final ``done`` event carries the same fields as
+    InterviewResponse (without audio) once the turn is committed.
+    
+    Args:
+        request: Text message request
+        
+    Returns:
+        Streaming response with ``text/event-stream`` content
+    """
+    from app.agent.interview_agent import get_interview_agent
+    from langchain_core.messages import HumanMessage
+    
+    session = await session_store.get(request.session_id)
+    if session is None:
+        raise HTTPException(status_code=404, detail="Session not found or expired")
+    
+    if not request.message or not request.message.strip():
+        raise HTTPException(status_code=400, detail="Message cannot be empty")
+    
+    config = session["config"]
+    
+    logger.info(f"Streaming text message for session {request.session_id}")
+    
+    user_message = HumanMessage(content=request.message)
+    
+    turn_input = {
+        "messages": [user_message],
+        "answers_given": [request.message],
+    }
+    
+    tokens: asyncio.Queue = asyncio.Queue()
+    
+    async def on_token(text: str):
+        await tokens.put(text)
+    
+    stream_config = {
+        **config,
+        "configurable": {**config["configurable"], "on_token": on_token},
+    }
+    
+    async def run_turn():
+        try:
+            return await get_interview_agent().ainvoke(turn_input, stream_config)
+        finally:
+            await tokens.put(None)  # End of stream marker
+    
+    async def event_stream():
+        turn = asyncio.create_task(run_turn())
+        
+        while (token := await tokens.get()) is not None:
+            yield f"data: {json.dumps({'token': token})}\n\n"
+        
+        try:
+            result = await turn
+        except Exception as e:
+            logger.error(f"Error streaming text message: {e}")
+            yield f"event: error\ndata: {json.dumps({'detail': str(e)})}\n\n"
+            return
+        
+        # Record turn progress; the full state is already checkpointed
+        current_stage = result.get("current_stage", _DEFAULT_STAGE)
+        question_number = result.get("question_number", 0)
+        session["current_stage"] = current_stage
+        session["question_number"] = question_number
+        await session_store.save(request.session_id, session)
+        
+        interviewer_text = _last_reply_text(result)
+        
+        done = {
+            "text_response": interviewer_text,
+            "audio_url": None,
+            "session_id": request.session_id,
+            "current_stage": current_stage.value,
+            "question_number": question_number,
+            "feedback": None
+        }
+        yield f"event: done\ndata: {json.dumps(done)}\n\n"
+    
+    return StreamingResponse(event_stream(), media_type="text/event-stream")
+
+
+@router.get("/interview/sessions/active")
+async def get_active_sessions():
+    """
+    Get list of active sessions (for admin/monitoring).
+    
+    Returns:
+        List of active session IDs and metadata
+    """
+    try:
+        active_sessions = []
+        for session_id, session_data in await session_store.list_sessions():
+            active_sessions.append({
+                "session_id": session_id,
+                "role": session_data["role"].value,
+                "experience_level": session_data["experience_level"],
+                "start_time": session_data["start_time"],
+                "question_number": session_data.get("question_number", 0),
+                "current_stage": session_data.get("current_stage", _DEFAULT_STAGE).value
+            })
+        
+        return {
+            "total_active_sessions": len(active_sessions),
+            "sessions": active_sessions
+        }
+        
+    except Exception as e:
+        logger.error(f"Error retrieving active sessions: {e}")
+        raise HTTPException(
+            status_code=500, 
+            detail=f"Failed to retrieve active sessions: {str(e)}"
+        )
+
+
 @router.get("/interview/{session_id}/feedback", response_model=FeedbackResponse)
-def get_interview_feedback(session_id: str):
+async def get_interview_feedback(session_id: str):
     """
     Get feedback for completed or ongoing interview.
     
@@ -317,11 +519,13 @@ def get_interview_feedback(session_id: str):
         Detailed feedback on interview performance
     """
     try:
-        if session_id not in sessions:
+        from app.agent.interview_agent import generate_feedback, load_interview_state
+        
+        session = await session_store.get(session_id)
+        if session is None:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        session = sessions[session_id]
-        state = session["state"]
+        state = await load_interview_state(session["config"])
         
         answers = state.get("answers_given", [])
         questions = state.get("questions_asked", [])
@@ -330,7 +534,7 @@ def get_interview_feedback(session_id: str):
         
         logger.info(f"Generating feedback for session {session_id}")
         
-        feedback = generate_feedback(answers, questions, role, experience_level)
+        feedback = await generate_feedback(answers, questions, role, experience_level)
         
         return feedback
         
@@ -344,8 +548,46 @@ def get_interview_feedback(session_id: str):
         )
 
 
+@router.get("/interview/{session_id}/audio/{turn_id}")
+async def get_turn_audio(session_id: str, turn_id: str):
+    """
+    Download the synthesized audio for one interviewer reply.
+    
+    Args:
+        session_id: Interview session ID
+        turn_id: Turn identifier from the reply's audio_url
+        
+    Audio that is still being synthesized is waited for, so the URL can be
+    used directly as an <audio> source: on the worker running the synthesis
+    the request awaits it, on other workers it polls the session store for
+    up to AUDIO_WAIT_TIMEOUT_SECONDS.
+    
+    Returns:
+        Raw WAV audio
+    """
+    audio_bytes = await session_store.get_audio(session_id, turn_id)
+    if audio_bytes == AUDIO_PENDING:
+        pending = _pending_audio.get((session_id, turn_id))
+        if pending is not None:
+            # Shield so a client disconnect does not cancel the synthesis
+            audio_bytes = await asyncio.shield(pending)
+        else:
+            loop = asyncio.get_running_loop()
+            deadline = loop.time() + AUDIO_WAIT_TIMEOUT_SECONDS
+            while audio_bytes == AUDIO_PENDING and loop.time() < deadline:
+                await asyncio.sleep(AUDIO_POLL_INTERVAL_SECONDS)
+                audio_bytes = await session_store.get_audio(session_id, turn_id)
+            if audio_bytes == AUDIO_PENDING:
+                raise HTTPException(status_code=504, detail="Audio is still being synthesized")
+    
+    if not audio_bytes:
+        raise HTTPException(status_code=404, detail="Audio not found or expired")
+    
+    return Response(content=audio_bytes, media_type="audio/wav")
+
+
 @router.get("/interview/{session_id}", response_model=InterviewSession)
-def get_session(session_id: str):
+async def get_session(session_id: str):
     """
     Get current session details.
     
@@ -356,11 +598,13 @@ def get_session(session_id: str):
         Current interview session state
     """
     try:
-        if session_id not in sessions:
+        from app.agent.interview_agent import load_interview_state
+        
+        session = await session_store.get(session_id)
+        if session is None:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        session = sessions[session_id]
-        state = session["state"]
+        state = await load_interview_state(session["config"])
         
         return {
             "session_id": session_id,
@@ -368,7 +612,7 @@ def get_session(session_id: str):
             "experience_level": session["experience_level"],
             "questions_asked": state.get("questions_asked", []),
             "answers_given": state.get("answers_given", []),
-            "current_stage": state.get("current_stage", InterviewStage.INTRODUCTION),
+            "current_stage": state.get("current_stage", _DEFAULT_STAGE),
             "start_time": session.get("start_time", ""),
             "end_time": session.get("end_time")
         }
@@ -384,7 +628,7 @@ def get_session(session_id: str):
 
 
 @router.post("/interview/{session_id}/end")
-def end_interview(session_id: str):
+async def end_interview(session_id: str):
     """
     End an interview session.
     
@@ -395,16 +639,18 @@ def end_interview(session_id: str):
         Confirmation message
     """
     try:
-        if session_id not in sessions:
+        session = await session_store.get(session_id)
+        if session is None:
             raise HTTPException(status_code=404, detail="Session not found")
         
-        sessions[session_id]["end_time"] = datetime.now().isoformat()
+        session["end_time"] = datetime.now().isoformat()
+        await session_store.save(session_id, session)
         logger.info(f"Interview session {session_id} ended")
         
         return {
             "message": "Interview ended successfully",
             "session_id": session_id,
-            "end_time": sessions[session_id]["end_time"]
+            "end_time": session["end_time"]
         }
         
     except HTTPException:
@@ -418,7 +664,7 @@ def end_interview(session_id: str):
 
 
 @router.delete("/interview/{session_id}")
-def delete_session(session_id: str):
+async def delete_session(session_id: str):
     """
     Delete an interview session from memory.
     
@@ -429,10 +675,12 @@ def delete_session(session_id: str):
         Confirmation message
     """
     try:
-        if session_id not in sessions:
+        from app.agent.interview_agent import delete_interview_state
+        
+        if not await session_store.delete(session_id):
             raise HTTPException(status_code=404, detail="Session not found")
+        await delete_interview_state(session_id)
         
-        del sessions[session_id]
         logger.info(f"Interview session {session_id} deleted")
         
         return {
@@ -448,38 +696,3 @@ def delete_session(session_id: str):
             status_code=500, 
             detail=f"Failed to delete session: {str(e)}"
         )
-
-
-@router.get("/interview/sessions/active")
-def get_active_sessions():
-    """
-    Get list of active sessions (for admin/monitoring).
-    
-    Returns:
-        List of active session IDs and metadata
-    """
-    try:
-        cleanup_expired_sessions()
-        
-        active_sessions = []
-        for session_id, session_data in sessions.items():
-            active_sessions.append({
-                "session_id": session_id,
-                "role": session_data["role"].value,
-                "experience_level": session_data["experience_level"],
-                "start_time": session_data["start_time"],
-                "question_number": session_data["state"].get("question_number", 0),
-                "current_stage": session_data["state"].get("current_stage", InterviewStage.INTRODUCTION).value
-            })
-        
-        return {
-            "total_active_sessions": len(active_sessions),
-            "sessions": active_sessions
-        }
-        
-    except Exception as e:
-        logger.error(f"Error retrieving active sessions: {e}")
-        raise HTTPException(
-            status_code=500, 
-            detail=f"Failed to retrieve active sessions: {str(e)}"
-        )
@@ -3,33 +3,54 @@
 
 import sys
 
-if sys.version_info >= (3, 12):
+# Shared default guard; typing only ever unions it into a new frozenset
+_EMPTY_GUARD = frozenset()
+
+
+def _pydantic_v1_version() -> tuple:
+    """Version of the pydantic v1 API in use (bundled as pydantic.v1 on pydantic 2)."""
+    try:
+        from pydantic.v1 import VERSION
+    except ImportError:
+        from pydantic import VERSION
+
+    return tuple(int(part) for part in str(VERSION).split(".")[:3] if part.isdigit())
+
+
+def needs_patch() -> bool:
+    """
+    Whether ForwardRef._evaluate must be patched.
+
+    Python 3.12 made `recursive_guard` keyword-only; pydantic v1 releases
+    before 1.10.16 still pass it positionally.
+    """
+    return sys.version_info >= (3, 12) and _pydantic_v1_version() < (1, 10, 16)
+
+
+def apply_patch() -> None:
+    """Install the ForwardRef._evaluate shim once, only when it is needed."""
     from typing import ForwardRef
 
+    if getattr(ForwardRef._evaluate, "_pydantic_py312_patch", False) or not needs_patch():
+        return
+
     _orig_evaluate = ForwardRef._evaluate
 
-    def _evaluate(self, *args, **kwargs):
+    def _evaluate(self, globalns, localns, *args, **kwargs):
         """
         Compatible with:
-        - Pydantic v1 calls
-        - Python 3.12 typing calls
+        - Pydantic v1 calls: _evaluate(globalns, localns, recursive_guard)
+        - Python 3.12 typing calls: _evaluate(globalns, localns, [type_params], recursive_guard=...)
         """
-
-        # If recursive_guard not provided, ensure it exists
         if "recursive_guard" not in kwargs:
-            kwargs["recursive_guard"] = set()
-
-        try:
-            return _orig_evaluate(self, *args, **kwargs)
-        except TypeError:
-            # Fallback for older call patterns
-            if len(args) >= 2:
-                return _orig_evaluate(
-                    self,
-                    args[0],
-                    args[1],
-                    kwargs.get("recursive_guard", set()),
-                )
-            raise
+            if len(args) == 1:
+                # Pydantic v1 passes the guard positionally
+                kwargs["recursive_guard"] = args[0]
+                args = ()
+            else:
+                kwargs["recursive_guard"] = _EMPTY_GUARD
+
+        return _orig_evaluate(self, globalns, localns, *args, **kwargs)
 
+    _evaluate._pydantic_py312_patch = True
     ForwardRef._evaluate = _evaluate
@@ -5,11 +5,19 @@ import logging
 # Load environment variables
 load_dotenv()
 
-# Configure logging
-logging.basicConfig(
-    level=logging.INFO,
-    format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+# Environment
+ENVIRONMENT = os.getenv("ENVIRONMENT", "development")  # development, staging, production
+DEBUG = os.getenv("DEBUG", "false").lower() == "true"
+
+# Logging Configuration
+LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING" if ENVIRONMENT == "production" else "INFO")
+LOG_FORMAT = os.getenv(
+    "LOG_FORMAT",
+    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
 )
+
+# Configure logging for the whole app; this is the only basicConfig call
+logging.basicConfig(level=LOG_LEVEL.upper(), format=LOG_FORMAT)
 logger = logging.getLogger(__name__)
 
 # API Keys
@@ -21,52 +29,61 @@ if not GOOGLE_API_KEY:
     logger.error("GOOGLE_API_KEY not found in environment variables")
     logger.error("Please create a .env file with GOOGLE_API_KEY=your_key_here")
 
-# Environment
-ENVIRONMENT = os.getenv("ENVIRONMENT", "development")  # development, staging, production
-DEBUG = os.getenv("DEBUG", "false").lower() == "true"
-
 # Interview Configuration
 INTERVIEW_DURATION_MINUTES = int(os.getenv("INTERVIEW_DURATION_MINUTES", "30"))
 MAX_QUESTION_TIME_SECONDS = int(os.getenv("MAX_QUESTION_TIME_SECONDS", "300"))  # 5 minutes per question
 MAX_QUESTIONS = int(os.getenv("MAX_QUESTIONS", "8"))
 FEEDBACK_ENABLED = os.getenv("FEEDBACK_ENABLED", "true").lower() == "true"
+FEEDBACK_MAX_CONCURRENCY = int(os.getenv("FEEDBACK_MAX_CONCURRENCY", "4"))  # Parallel per-question feedback calls
 
 # Voice Configuration
 AUDIO_SAMPLE_RATE = int(os.getenv("AUDIO_SAMPLE_RATE", "16000"))
 AUDIO_CHANNELS = int(os.getenv("AUDIO_CHANNELS", "1"))
 AUDIO_FORMAT = os.getenv("AUDIO_FORMAT", "wav")
+AUDIO_TTL_SECONDS = int(os.getenv("AUDIO_TTL_SECONDS", "300"))  # How long synthesized replies stay fetchable
+TTS_CACHE_SIZE = int(os.getenv("TTS_CACHE_SIZE", "256"))  # Synthesized phrases kept in memory (0 disables)
+STT_MAX_WORKERS = int(os.getenv("STT_MAX_WORKERS", str(min(4, os.cpu_count() or 1))))  # Concurrent transcriptions
+TTS_PIPER_MODEL = os.getenv("TTS_PIPER_MODEL", "")  # Path to a Piper .onnx voice; empty uses pyttsx3
 
 # Session Management
 SESSION_TIMEOUT_SECONDS = int(os.getenv("SESSION_TIMEOUT_SECONDS", "1800"))  # 30 minutes
 MAX_SESSIONS = int(os.getenv("MAX_SESSIONS", "100"))  # Maximum concurrent sessions
+SESSION_CLEANUP_INTERVAL_SECONDS = int(os.getenv("SESSION_CLEANUP_INTERVAL_SECONDS", "60"))  # Background sweep of expired in-memory sessions
 
 # LLM Configuration
 LLM_MODEL = os.getenv("LLM_MODEL", "gemini-2.5-flash-lite")
 LLM_TEMPERATURE = float(os.getenv("LLM_TEMPERATURE", "0.7"))
 LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
 LLM_TIMEOUT = int(os.getenv("LLM_TIMEOUT", "30"))
-
-# CORS Configuration
-CORS_ORIGINS = os.getenv(
-    "CORS_ORIGINS",
-    "http://localhost:3000,http://localhost:5173,http://127.0.0.1:3000,http://127.0.0.1:5173"
-).split(",")
+LLM_TRANSPORT = os.getenv("LLM_TRANSPORT", "grpc")  # grpc, rest
+LLM_API_ENDPOINT = os.getenv("LLM_API_ENDPOINT", "generativelanguage.googleapis.com")
+PROMPT_CACHE_MIN_TOKENS = int(os.getenv("PROMPT_CACHE_MIN_TOKENS", "1024"))  # Provider minimum for implicit prefix caching
+
+# Response Cache Configuration (generated greetings only; replies depend on history)
+RESPONSE_CACHE_ENABLED = os.getenv("RESPONSE_CACHE_ENABLED", "true").lower() == "true"
+
+# CORS Configuration (parsed once; whitespace around entries is ignored)
+CORS_ORIGINS = tuple(
+    origin.strip()
+    for origin in os.getenv(
+        "CORS_ORIGINS",
+        "http://localhost:3000,http://localhost:5173,http://127.0.0.1:3000,http://127.0.0.1:5173"
+    ).split(",")
+    if origin.strip()
+)
 
 # Rate Limiting (for production)
 RATE_LIMIT_ENABLED = os.getenv("RATE_LIMIT_ENABLED", "false").lower() == "true"
 RATE_LIMIT_PER_MINUTE = int(os.getenv("RATE_LIMIT_PER_MINUTE", "60"))
 
+# Checkpoint Storage (LangGraph interview state)
+CHECKPOINT_DB = os.getenv("CHECKPOINT_DB", "interviews.db")  # SQLite path, or ":memory:"
+CHECKPOINT_WRITE_BATCH_SIZE = int(os.getenv("CHECKPOINT_WRITE_BATCH_SIZE", "1"))  # Persist every Nth turn per session (1 = every turn)
+
 # Database Configuration (for future use)
 DATABASE_URL = os.getenv("DATABASE_URL", None)  # PostgreSQL connection string
 REDIS_URL = os.getenv("REDIS_URL", None)  # Redis connection string for session storage
 
-# Logging Configuration
-LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
-LOG_FORMAT = os.getenv(
-    "LOG_FORMAT",
-    "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
-)
-
 # Security
 SECRET_KEY = os.getenv("SECRET_KEY", "your-secret-key-change-in-production")
 if ENVIRONMENT == "production" and SECRET_KEY == "your-secret-key-change-in-production":
@@ -87,7 +104,6 @@ ENABLE_ANALYTICS = os.getenv("ENABLE_ANALYTICS", "false").lower() == "true"
 if ENVIRONMENT == "production":
     # Override settings for production
     DEBUG = False
-    LOG_LEVEL = os.getenv("LOG_LEVEL", "WARNING")
     
     # Ensure critical settings are configured
     if not DATABASE_URL and not REDIS_URL:
@@ -96,8 +112,8 @@ if ENVIRONMENT == "production":
             "Using in-memory storage is not recommended for production."
         )
 
-logger.info(f"Configuration loaded for environment: {ENVIRONMENT}")
-logger.info(f"Debug mode: {DEBUG}")
-logger.info(f"LLM Model: {LLM_MODEL}")
-logger.info(f"Voice enabled: {ENABLE_VOICE}")
-logger.info(f"Text enabled: {ENABLE_TEXT}")
+if logger.isEnabledFor(logging.INFO):
+    logger.info(
+        f"Configuration loaded for environment: {ENVIRONMENT} "
+        f"(debug={DEBUG}, llm_model={LLM_MODEL}, voice={ENABLE_VOICE}, text={ENABLE_TEXT})"
+    )
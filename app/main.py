@@ -1,6 +1,6 @@
 from fastapi import FastAPI, Request
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, ORJSONResponse, Response
 from app.api.interview import router as interview_router
 from app.config import (
     CORS_ORIGINS,
@@ -9,11 +9,24 @@ from app.config import (
     API_TITLE,
     API_VERSION,
     API_DESCRIPTION,
-    API_V1_PREFIX
+    API_V1_PREFIX,
+    ENABLE_VOICE,
+    GOOGLE_API_KEY
 )
+import asyncio
+import json
 import logging
 import time
 
+# Optional import - faster JSON serialization when installed
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+# Response class used for every JSON body, including error responses
+DefaultJSONResponse = ORJSONResponse if orjson is not None else JSONResponse
+
 # Configure logging
 logger = logging.getLogger(__name__)
 
@@ -25,6 +38,7 @@ app = FastAPI(
     debug=DEBUG,
     docs_url="/docs" if ENVIRONMENT != "production" else None,  # Disable docs in production
     redoc_url="/redoc" if ENVIRONMENT != "production" else None,
+    default_response_class=DefaultJSONResponse,
 )
 
 # CORS Middleware
@@ -41,26 +55,30 @@ app.add_middleware(
 @app.middleware("http")
 async def log_requests(request: Request, call_next):
     """Log all requests with timing information."""
-    start_time = time.time()
+    start_ns = time.perf_counter_ns()
+    log_info = logger.isEnabledFor(logging.INFO)
     
     # Log request
-    logger.info(f"Request: {request.method} {request.url.path}")
+    if log_info:
+        logger.info(f"Request: {request.method} {request.url.path}")
     
     try:
         response = await call_next(request)
         
-        # Calculate processing time
-        process_time = time.time() - start_time
+        # Calculate processing time (monotonic clock, no wall-clock syscall)
+        process_time = (time.perf_counter_ns() - start_ns) / 1e9
         
         # Log response
-        logger.info(
-            f"Response: {request.method} {request.url.path} "
-            f"Status: {response.status_code} "
-            f"Duration: {process_time:.3f}s"
-        )
+        if log_info:
+            logger.info(
+                f"Response: {request.method} {request.url.path} "
+                f"Status: {response.status_code} "
+                f"Duration: {process_time:.3f}s"
+            )
         
-        # Add custom headers
-        response.headers["X-Process-Time"] = str(process_time)
+        # Timing header is only useful while debugging
+        if DEBUG:
+            response.headers["X-Process-Time"] = str(process_time)
         
         return response
     
@@ -75,7 +93,7 @@ async def global_exception_handler(request: Request, exc: Exception):
     """Handle uncaught exceptions gracefully."""
     logger.error(f"Unhandled exception: {exc}", exc_info=True)
     
-    return JSONResponse(
+    return DefaultJSONResponse(
         status_code=500,
         content={
             "detail": "An internal server error occurred" if ENVIRONMENT == "production" else str(exc),
@@ -88,39 +106,56 @@ async def global_exception_handler(request: Request, exc: Exception):
 app.include_router(interview_router, prefix=API_V1_PREFIX, tags=["interview"])
 
 
+def _dump_json(payload) -> bytes:
+    """Serialize a payload once, with orjson when available."""
+    if orjson is not None:
+        return orjson.dumps(payload)
+    return json.dumps(payload, separators=(",", ":")).encode()
+
+
+# Static endpoint bodies, serialized once at import instead of per request
+_ROOT_BODY = _dump_json({
+    "service": "Mock Interview Agent API",
+    "version": API_VERSION,
+    "environment": ENVIRONMENT,
+    "status": "running",
+    "endpoints": {
+        "start_interview": f"{API_V1_PREFIX}/interview/start",
+        "voice_message": f"{API_V1_PREFIX}/interview/voice",
+        "text_message": f"{API_V1_PREFIX}/interview/text",
+        "text_message_stream": f"{API_V1_PREFIX}/interview/text/stream",
+        "get_feedback": f"{API_V1_PREFIX}/interview/{{session_id}}/feedback",
+        "get_session": f"{API_V1_PREFIX}/interview/{{session_id}}",
+        "end_interview": f"{API_V1_PREFIX}/interview/{{session_id}}/end",
+        "active_sessions": f"{API_V1_PREFIX}/interview/sessions/active",
+        "health": "/health",
+        "docs": "/docs" if ENVIRONMENT != "production" else "disabled in production"
+    }
+})
+
+# Everything but the timestamp, left open so only the time is appended per probe
+_HEALTH_BODY_PREFIX = _dump_json({
+    "status": "healthy",
+    "environment": ENVIRONMENT,
+    "version": API_VERSION,
+})[:-1] + b',"timestamp":'
+
+
 # Root endpoint
 @app.get("/")
-def root():
+async def root():
     """API root endpoint with service information."""
-    return {
-        "service": "Mock Interview Agent API",
-        "version": API_VERSION,
-        "environment": ENVIRONMENT,
-        "status": "running",
-        "endpoints": {
-            "start_interview": f"{API_V1_PREFIX}/interview/start",
-            "voice_message": f"{API_V1_PREFIX}/interview/voice",
-            "text_message": f"{API_V1_PREFIX}/interview/text",
-            "get_feedback": f"{API_V1_PREFIX}/interview/{{session_id}}/feedback",
-            "get_session": f"{API_V1_PREFIX}/interview/{{session_id}}",
-            "end_interview": f"{API_V1_PREFIX}/interview/{{session_id}}/end",
-            "active_sessions": f"{API_V1_PREFIX}/interview/sessions/active",
-            "health": "/health",
-            "docs": "/docs" if ENVIRONMENT != "production" else "disabled in production"
-        }
-    }
+    return Response(content=_ROOT_BODY, media_type="application/json")
 
 
 # Health check endpoint
 @app.get("/health")
-def health_check():
+async def health_check():
     """Health check endpoint for monitoring and load balancers."""
-    return {
-        "status": "healthy",
-        "environment": ENVIRONMENT,
-        "version": API_VERSION,
-        "timestamp": time.time()
-    }
+    return Response(
+        content=_HEALTH_BODY_PREFIX + repr(time.time()).encode() + b"}",
+        media_type="application/json"
+    )
 
 
 # Readiness check endpoint
@@ -130,10 +165,8 @@ def readiness_check():
     try:
         # Check if critical services are ready
         # Add checks for database, Redis, etc. when implemented
-        from app.config import GOOGLE_API_KEY
-        
         if not GOOGLE_API_KEY:
-            return JSONResponse(
+            return DefaultJSONResponse(
                 status_code=503,
                 content={
                     "status": "not_ready",
@@ -141,6 +174,17 @@ def readiness_check():
                 }
             )
         
+        if ENABLE_VOICE:
+            from app.voice.speech_handler import stt_ready
+            if not stt_ready.is_set():
+                return DefaultJSONResponse(
+                    status_code=503,
+                    content={
+                        "status": "not_ready",
+                        "reason": "Speech-to-text model is still loading"
+                    }
+                )
+        
         return {
             "status": "ready",
             "environment": ENVIRONMENT,
@@ -149,7 +193,7 @@ def readiness_check():
     
     except Exception as e:
         logger.error(f"Readiness check failed: {e}")
-        return JSONResponse(
+        return DefaultJSONResponse(
             status_code=503,
             content={
                 "status": "not_ready",
@@ -158,6 +202,10 @@ def readiness_check():
         )
 
 
+# Background task handle for the session sweep
+_session_cleanup_task = None
+
+
 # Startup event
 @app.on_event("startup")
 async def startup_event():
@@ -167,7 +215,6 @@ async def startup_event():
     logger.info(f"Debug mode: {DEBUG}")
     
     # Validate configuration
-    from app.config import GOOGLE_API_KEY
     if not GOOGLE_API_KEY:
         logger.error("GOOGLE_API_KEY not found! Application may not function correctly.")
     else:
@@ -176,11 +223,30 @@ async def startup_event():
     # Initialize services
     logger.info("Initializing LangGraph agent...")
     try:
-        from app.agent.interview_agent import interview_agent
+        from app.agent.interview_agent import get_interview_agent
+        checkpointer = get_interview_agent().checkpointer
+        # Open the checkpoint store once here rather than racing on first use
+        if hasattr(checkpointer, "setup"):
+            await checkpointer.setup()
         logger.info("LangGraph agent initialized successfully")
     except Exception as e:
         logger.error(f"Failed to initialize LangGraph agent: {e}")
     
+    # Load the speech model on a background thread so the server starts
+    # accepting requests immediately; /ready reports not_ready until it is done
+    if ENABLE_VOICE:
+        from app.voice.speech_handler import warm_up_in_background
+        warm_up_in_background()
+    
+    # Sweep expired sessions (and their checkpoints) in the background
+    # instead of on requests
+    global _session_cleanup_task
+    from app.agent.interview_agent import delete_interview_state
+    from app.storage.session_store import run_periodic_cleanup, session_store
+    _session_cleanup_task = asyncio.create_task(
+        run_periodic_cleanup(session_store, on_expired=delete_interview_state)
+    )
+    
     logger.info("Application startup complete")
 
 
@@ -192,18 +258,36 @@ async def shutdown_event():
     
     # Clean up resources
     # Close database connections, clear caches, etc.
+    if _session_cleanup_task is not None:
+        _session_cleanup_task.cancel()
+    
+    # Write out any checkpoints still buffered by a batching checkpointer,
+    # then close the checkpoint store so its worker thread can exit
+    try:
+        from app.agent.interview_agent import get_interview_agent
+        checkpointer = get_interview_agent().checkpointer
+        if hasattr(checkpointer, "aflush"):
+            await checkpointer.aflush()
+        if hasattr(checkpointer, "aclose"):
+            await checkpointer.aclose()
+    except Exception as e:
+        logger.error(f"Failed to flush checkpoints: {e}")
     
     logger.info("Application shutdown complete")
 
 
 if __name__ == "__main__":
+    from importlib.util import find_spec
     import uvicorn
     
-    # Run the application
+    # Run the application on the C-accelerated event loop and HTTP parser
+    # when they are installed (uvloop is unavailable on Windows)
     uvicorn.run(
         "app.main:app",
         host="0.0.0.0",
         port=8002,
         reload=DEBUG,  # Auto-reload in development
+        loop="uvloop" if find_spec("uvloop") else "asyncio",
+        http="httptools" if find_spec("httptools") else "h11",
         log_level="info" if DEBUG else "warning"
     )
@@ -1,5 +1,5 @@
-from pydantic import BaseModel
-from typing import Optional, List, Dict
+from pydantic import BaseModel, ConfigDict, Field
+from typing import Any, Optional
 from enum import Enum
 
 class InterviewRole(str, Enum):
@@ -14,37 +14,63 @@ class InterviewStage(str, Enum):
     BEHAVIORAL = "behavioral"
     CLOSING = "closing"
 
+# Request/response models are never mutated after validation
+SCHEMA_CONFIG = ConfigDict(frozen=True, extra="ignore")
+
+# Response-only models keep enum fields as their plain string values,
+# so serialization skips the enum -> .value step
+RESPONSE_SCHEMA_CONFIG = ConfigDict(frozen=True, extra="ignore", use_enum_values=True)
+
 class InterviewRequest(BaseModel):
+    model_config = SCHEMA_CONFIG
+
     role: InterviewRole = InterviewRole.GENERAL
     experience_level: str = "mid"  # junior, mid, senior
     user_name: Optional[str] = None
 
 class VoiceMessageRequest(BaseModel):
+    model_config = SCHEMA_CONFIG
+
     audio_data: str  # Base64 encoded audio
     session_id: str
     interview_stage: Optional[InterviewStage] = None
 
 class InterviewResponse(BaseModel):
+    model_config = RESPONSE_SCHEMA_CONFIG
+
     text_response: str
     audio_url: Optional[str] = None
     session_id: str
     current_stage: InterviewStage
     question_number: int
-    feedback: Optional[Dict] = None
+    feedback: Optional[dict[str, Any]] = None
+
+class QuestionFeedback(BaseModel):
+    model_config = SCHEMA_CONFIG
+
+    score: float = Field(ge=0, le=100)
+    strength: str
+    improvement: str
+    recommendation: str
+    analysis: str = ""
 
 class FeedbackResponse(BaseModel):
+    model_config = SCHEMA_CONFIG
+
     overall_score: float
-    strengths: List[str]
-    areas_for_improvement: List[str]
-    detailed_feedback: Dict
-    recommendations: List[str]
+    strengths: list[str]
+    areas_for_improvement: list[str]
+    detailed_feedback: dict[str, Any]
+    recommendations: list[str]
 
 class InterviewSession(BaseModel):
+    model_config = RESPONSE_SCHEMA_CONFIG
+
     session_id: str
     role: InterviewRole
     experience_level: str
-    questions_asked: List[str]
-    answers_given: List[str]
+    questions_asked: list[str]
+    answers_given: list[str]
     current_stage: InterviewStage
     start_time: str
     end_time: Optional[str] = None
@@ -0,0 +1,283 @@
+from app.config import (
+    AUDIO_TTL_SECONDS,
+    REDIS_URL,
+    SESSION_CLEANUP_INTERVAL_SECONDS,
+    SESSION_TIMEOUT_SECONDS
+)
+from app.models.schemas import InterviewRole, InterviewStage
+from collections import OrderedDict
+from enum import Enum
+from typing import Awaitable, Callable, Dict, List, Optional, Tuple
+import asyncio
+import logging
+import pickle
+import time
+
+# Optional import - only needed when REDIS_URL is configured
+try:
+    import redis.asyncio as aioredis
+except ImportError:
+    aioredis = None
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+logger = logging.getLogger(__name__)
+
+SESSION_KEY_PREFIX = "sess:"
+AUDIO_KEY_PREFIX = "audio:"
+# Interview checkpoints written by AsyncRedisSaver, expiring with the session
+CHECKPOINT_KEY_PREFIX = "ckpt:"
+
+# Stored in place of a turn's audio while it is still being synthesized
+AUDIO_PENDING = b""
+
+# Enum-typed session fields, persisted as their plain values
+_ENUM_FIELDS = {"role": InterviewRole, "current_stage": InterviewStage}
+
+
+def encode_session(data: Dict) -> bytes:
+    """
+    Serialize session metadata for Redis.
+
+    Enums are stored as their plain values and the dict is packed with
+    msgpack, which is far smaller than a pickle carrying enum class paths.
+    Falls back to pickle if msgpack is not installed.
+    """
+    if msgpack is None:
+        return pickle.dumps(data)
+    return msgpack.packb(
+        {key: value.value if isinstance(value, Enum) else value for key, value in data.items()},
+        use_bin_type=True
+    )
+
+
+def decode_session(payload: bytes) -> Dict:
+    """Inverse of encode_session, restoring enum-typed fields."""
+    if msgpack is None:
+        return pickle.loads(payload)
+    data = msgpack.unpackb(payload, raw=False)
+    for field, enum_cls in _ENUM_FIELDS.items():
+        if data.get(field) is not None:
+            data[field] = enum_cls(data[field])
+    return data
+
+
+class InMemorySessionStore:
+    """
+    Process-local session storage for development and single-worker setups.
+
+    Activity timestamps are kept in an OrderedDict that is re-ordered on every
+    touch, so it is always sorted oldest-first. Expiry sweeps stop at the
+    first live session and cost O(expired) rather than O(all sessions).
+    Audio entries share one TTL and are never re-inserted, so plain insertion
+    order sorts them the same way. IDs of expired sessions are kept until
+    drain_expired() so their interview state can be dropped as well.
+    """
+
+    def __init__(self, timeout_seconds: int = SESSION_TIMEOUT_SECONDS):
+        self.timeout_seconds = timeout_seconds
+        self._sessions: Dict[str, Dict] = {}
+        self._last_activity: "OrderedDict[str, float]" = OrderedDict()
+        self._audio: Dict[Tuple[str, str], Tuple[float, bytes]] = {}
+        self._expired: List[str] = []
+
+    def _is_expired(self, session_id: str, now: float) -> bool:
+        last_activity = self._last_activity.get(session_id)
+        return last_activity is not None and now - last_activity > self.timeout_seconds
+
+    def _touch(self, session_id: str, now: float) -> None:
+        self._last_activity[session_id] = now
+        self._last_activity.move_to_end(session_id)
+
+    def _remove(self, session_id: str) -> None:
+        self._sessions.pop(session_id, None)
+        self._last_activity.pop(session_id, None)
+
+    def _expire(self, session_id: str) -> None:
+        self._remove(session_id)
+        self._expired.append(session_id)
+        logger.info(f"Cleaned up expired session: {session_id}")
+
+    async def get(self, session_id: str) -> Optional[Dict]:
+        """Return session data and refresh its activity timestamp, or None if missing/expired."""
+        now = time.monotonic()
+        if self._is_expired(session_id, now):
+            self._expire(session_id)
+            return None
+
+        session = self._sessions.get(session_id)
+        if session is not None:
+            self._touch(session_id, now)
+        return session
+
+    async def save(self, session_id: str, data: Dict) -> None:
+        """Create or replace session data."""
+        self._sessions[session_id] = data
+        self._touch(session_id, time.monotonic())
+
+    async def delete(self, session_id: str) -> bool:
+        """Delete a session. Returns False if it did not exist."""
+        existed = session_id in self._sessions
+        self._remove(session_id)
+        return existed
+
+    async def list_sessions(self) -> List[Tuple[str, Dict]]:
+        """Return all live sessions, dropping expired ones."""
+        await self.cleanup_expired()
+        return list(self._sessions.items())
+
+    async def cleanup_expired(self) -> int:
+        """Drop expired sessions and audio. Returns the number of sessions removed."""
+        now = time.monotonic()
+        removed = 0
+        while self._last_activity:
+            session_id = next(iter(self._last_activity))
+            if not self._is_expired(session_id, now):
+                break
+            self._expire(session_id)
+            removed += 1
+
+        while self._audio:
+            key = next(iter(self._audio))
+            if self._audio[key][0] > now:
+                break
+            del self._audio[key]
+
+        return removed
+
+    def drain_expired(self) -> List[str]:
+        """Return and forget the IDs of sessions expired since the last call."""
+        expired, self._expired = self._expired, []
+        return expired
+
+    async def save_audio(self, session_id: str, turn_id: str, audio: bytes) -> None:
+        """Keep a turn's synthesized audio (or AUDIO_PENDING) for AUDIO_TTL_SECONDS."""
+        key = (session_id, turn_id)
+        # Re-insert at the end so insertion order stays sorted by expiry
+        self._audio.pop(key, None)
+        self._audio[key] = (time.monotonic() + AUDIO_TTL_SECONDS, audio)
+
+    async def discard_audio(self, session_id: str, turn_id: str) -> None:
+        """Forget a turn's audio, e.g. when its synthesis failed."""
+        self._audio.pop((session_id, turn_id), None)
+
+    async def get_audio(self, session_id: str, turn_id: str) -> Optional[bytes]:
+        """Return a turn's audio (AUDIO_PENDING while synthesizing), or None if missing/expired."""
+        entry = self._audio.get((session_id, turn_id))
+        if entry is None or entry[0] <= time.monotonic():
+            return None
+        return entry[1]
+
+
+class RedisSessionStore:
+    """
+    Redis-backed session storage shared by all workers.
+
+    Each session is a msgpack payload under ``sess:<id>`` with a TTL of the
+    session timeout. Reads slide the TTL, so Redis expires idle sessions
+    itself and no cleanup sweep is needed. The session's interview checkpoint
+    under ``ckpt:<id>`` gets the same TTL in the same round trip, so the two
+    always expire together. Synthesized reply audio is kept as raw bytes
+    under ``audio:<id>:<turn>`` with a short TTL.
+    """
+
+    def __init__(self, redis_url: str, timeout_seconds: int = SESSION_TIMEOUT_SECONDS):
+        self.timeout_seconds = timeout_seconds
+        self._redis = aioredis.Redis.from_url(redis_url)
+
+    @staticmethod
+    def _key(session_id: str) -> str:
+        return f"{SESSION_KEY_PREFIX}{session_id}"
+
+    async def get(self, session_id: str) -> Optional[Dict]:
+        """Return session data and slide its (and its checkpoint's) TTL, or None if missing/expired."""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.getex(self._key(session_id), ex=self.timeout_seconds)
+            pipe.expire(f"{CHECKPOINT_KEY_PREFIX}{session_id}", self.timeout_seconds)
+            payload, _ = await pipe.execute()
+        return decode_session(payload) if payload is not None else None
+
+    async def save(self, session_id: str, data: Dict) -> None:
+        """Create or replace session data, resetting its (and its checkpoint's) TTL."""
+        async with self._redis.pipeline(transaction=False) as pipe:
+            pipe.set(self._key(session_id), encode_session(data), ex=self.timeout_seconds)
+            pipe.expire(f"{CHECKPOINT_KEY_PREFIX}{session_id}", self.timeout_seconds)
+            await pipe.execute()
+
+    async def delete(self, session_id: str) -> bool:
+        """Delete a session. Returns False if it did not exist."""
+        return bool(await self._redis.delete(self._key(session_id)))
+
+    async def list_sessions(self) -> List[Tuple[str, Dict]]:
+        """Return all live sessions using SCAN rather than KEYS."""
+        sessions = []
+        async for key in self._redis.scan_iter(match=f"{SESSION_KEY_PREFIX}*"):
+            payload = await self._redis.get(key)
+            if payload is not None:
+                session_id = key.decode()[len(SESSION_KEY_PREFIX):]
+                sessions.append((session_id, decode_session(payload)))
+        return sessions
+
+    async def save_audio(self, session_id: str, turn_id: str, audio: bytes) -> None:
+        """Store a turn's raw audio (or AUDIO_PENDING) under ``audio:<id>:<turn>`` for AUDIO_TTL_SECONDS."""
+        await self._redis.set(f"{AUDIO_KEY_PREFIX}{session_id}:{turn_id}", audio, ex=AUDIO_TTL_SECONDS)
+
+    async def discard_audio(self, session_id: str, turn_id: str) -> None:
+        """Forget a turn's audio, e.g. when its synthesis failed."""
+        await self._redis.delete(f"{AUDIO_KEY_PREFIX}{session_id}:{turn_id}")
+
+    async def get_audio(self, session_id: str, turn_id: str) -> Optional[bytes]:
+        """Return a turn's audio (AUDIO_PENDING while synthesizing), or None if missing/expired."""
+        return await self._redis.get(f"{AUDIO_KEY_PREFIX}{session_id}:{turn_id}")
+
+    async def cleanup_expired(self) -> int:
+        """No-op: Redis expires sessions and audio through their TTLs."""
+        return 0
+
+    def drain_expired(self) -> List[str]:
+        """Nothing to report; expired keys are dropped by Redis."""
+        return []
+
+
+def create_session_store():
+    """Create the Redis session store when REDIS_URL is set, else an in-memory one."""
+    if REDIS_URL:
+        if aioredis is None:
+            logger.warning("REDIS_URL is set but the redis package is not installed; using in-memory sessions")
+        else:
+            logger.info("Using Redis session store")
+            return RedisSessionStore(REDIS_URL)
+
+    return InMemorySessionStore()
+
+
+async def run_periodic_cleanup(
+    store,
+    interval_seconds: int = SESSION_CLEANUP_INTERVAL_SECONDS,
+    on_expired: Optional[Callable[[str], Awaitable[None]]] = None
+) -> None:
+    """
+    Sweep expired sessions in the background, off the request path.
+    
+    Args:
+        store: Session store to sweep
+        interval_seconds: Delay between sweeps
+        on_expired: Optional async callback run for each expired session ID
+    """
+    while True:
+        await asyncio.sleep(interval_seconds)
+        try:
+            removed = await store.cleanup_expired()
+            if removed:
+                logger.info(f"Session sweep removed {removed} expired session(s)")
+            if on_expired is not None:
+                for session_id in store.drain_expired():
+                    await on_expired(session_id)
+        except Exception as e:
+            logger.warning(f"Session cleanup failed: {e}")
+
+
+session_store = create_session_store()
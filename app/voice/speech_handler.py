@@ -1,36 +1,112 @@
+import asyncio
 import io
-import base64
+import math
+import binascii
+import hashlib
 import tempfile
 import os
+import threading
+import wave
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
+from cachetools import LRUCache
+from app.config import STT_MAX_WORKERS, TTS_CACHE_SIZE, TTS_PIPER_MODEL
 
-# Optional imports - handle gracefully if not installed
+# Optional imports - handle gracefully if not installed.
+# Whisper (and torch behind it) is imported on first transcription instead,
+# see SpeechHandler.whisper_model.
 try:
-    import whisper
+    import pyttsx3
 except ImportError:
-    whisper = None
+    pyttsx3 = None
 
 try:
-    import pyttsx3
+    import numpy as np
 except ImportError:
-    pyttsx3 = None
+    np = None
+
+# Whisper's native input format: 16 kHz mono float32 in [-1, 1]
+WHISPER_SAMPLE_RATE = 16000
+
+# Bounded pool for transcriptions so bursts queue up instead of spawning
+# a thread (and a full Whisper forward pass) per request
+_STT_POOL = ThreadPoolExecutor(max_workers=STT_MAX_WORKERS, thread_name_prefix="stt")
+
+# Set once the speech-to-text model load has been attempted (see warm_up)
+stt_ready = threading.Event()
+
+# Keep temporary audio files on tmpfs where available (Linux), off the disk
+_AUDIO_TMP_DIR = "/dev/shm" if os.path.isdir("/dev/shm") else None
+
+
+def pcm_wav_to_float32(audio_data: bytes):
+    """
+    Convert 16-bit PCM WAV bytes straight to a Whisper input array.
+    
+    Uses vectorized numpy ops, so no per-sample Python work. Whisper accepts
+    the array directly, skipping the temp file and the ffmpeg decode. Other
+    sample rates are resampled to 16 kHz with scipy's polyphase filter.
+    
+    Args:
+        audio_data: Raw audio bytes
+        
+    Returns:
+        float32 samples at 16 kHz, or None if the audio is not 16-bit PCM WAV
+        (or cannot be resampled here)
+    """
+    if np is None:
+        return None
+    
+    try:
+        with wave.open(io.BytesIO(audio_data)) as wav:
+            if wav.getsampwidth() != 2:
+                return None
+            rate = wav.getframerate()
+            channels = wav.getnchannels()
+            frames = wav.readframes(wav.getnframes())
+    except (wave.Error, EOFError):
+        return None
+    
+    samples = np.frombuffer(frames, dtype=np.int16)
+    if channels > 1:
+        samples = samples.reshape(-1, channels).mean(axis=1)
+    samples = samples.astype(np.float32) / 32768.0
+    
+    if rate != WHISPER_SAMPLE_RATE:
+        try:
+            from scipy.signal import resample_poly
+        except ImportError:
+            return None
+        g = math.gcd(WHISPER_SAMPLE_RATE, rate)
+        samples = resample_poly(samples, WHISPER_SAMPLE_RATE // g, rate // g).astype(np.float32)
+    
+    return samples
+
 
 class SpeechHandler:
     def __init__(self):
         """Initialize speech-to-text and text-to-speech handlers."""
-        # Initialize Whisper model (small model for faster processing)
-        if whisper is None:
-            self.whisper_model = None
-            print("Warning: Whisper not installed. Speech-to-text will not be available.")
-        else:
-            try:
-                self.whisper_model = whisper.load_model("base")
-            except Exception as e:
-                print(f"Warning: Could not load Whisper model: {e}")
-                self.whisper_model = None
+        # pyttsx3 engines are not thread-safe; the API calls us from a thread pool
+        self._tts_lock = threading.Lock()
+        
+        # Synthesized audio keyed by a 16-byte blake2b of the text; repeated interviewer
+        # phrases are spoken from here instead of re-running TTS
+        self._tts_cache = LRUCache(maxsize=TTS_CACHE_SIZE)
+        self._tts_cache_lock = threading.Lock()
+        
+        # Whisper model is loaded on first use
+        self._whisper_model = None
+        self._whisper_loaded = False
+        self._faster_whisper = False
+        self._whisper_device = "cpu"
+        self._whisper_lock = threading.Lock()
         
-        # Initialize TTS engine
-        if pyttsx3 is None:
+        # Initialize TTS engine: Piper (ONNX Runtime) when a voice model is
+        # configured, otherwise the system engine through pyttsx3
+        self.piper_voice = self._load_piper_voice()
+        if self.piper_voice is not None:
+            self.tts_engine = None
+        elif pyttsx3 is None:
             self.tts_engine = None
             print("Warning: pyttsx3 not installed. Text-to-speech will not be available.")
         else:
@@ -50,6 +126,96 @@ class SpeechHandler:
                 print(f"Warning: Could not initialize TTS: {e}")
                 self.tts_engine = None
     
+    @staticmethod
+    def _load_piper_voice():
+        """Load the Piper voice model from TTS_PIPER_MODEL, if configured."""
+        if not TTS_PIPER_MODEL:
+            return None
+        
+        try:
+            from piper.voice import PiperVoice
+            return PiperVoice.load(TTS_PIPER_MODEL)
+        except Exception as e:
+            print(f"Warning: Could not load Piper voice {TTS_PIPER_MODEL}: {e}")
+            return None
+    
+    @property
+    def tts_available(self) -> bool:
+        """Whether any text-to-speech backend is loaded."""
+        return self.piper_voice is not None or self.tts_engine is not None
+    
+    @property
+    def whisper_model(self):
+        """Whisper model, imported and loaded on first access (None if unavailable)."""
+        if not self._whisper_loaded:
+            with self._whisper_lock:
+                if not self._whisper_loaded:
+                    self._whisper_model = self._load_whisper_model()
+                    self._whisper_loaded = True
+                    stt_ready.set()
+        return self._whisper_model
+    
+    def warm_up(self) -> None:
+        """Load the speech-to-text model now instead of on the first request."""
+        self.whisper_model
+    
+    def _load_whisper_model(self):
+        """
+        Load the speech-to-text model, preferring faster-whisper.
+        
+        faster-whisper runs the same "base" model on CTranslate2 with INT8
+        quantized CPU kernels, several times faster and lighter than the
+        PyTorch reference implementation, which is used as the fallback.
+        Either backend runs on the GPU in float16 when CUDA is available.
+        """
+        try:
+            from faster_whisper import WhisperModel
+        except ImportError:
+            WhisperModel = None
+        
+        if WhisperModel is not None:
+            try:
+                import ctranslate2
+                if ctranslate2.get_cuda_device_count() > 0:
+                    model = WhisperModel("base", device="cuda", compute_type="float16")
+                    self._whisper_device = "cuda"
+                else:
+                    model = WhisperModel(
+                        "base", device="cpu", compute_type="int8", cpu_threads=os.cpu_count() or 0
+                    )
+                self._faster_whisper = True
+                return model
+            except Exception as e:
+                print(f"Warning: Could not load faster-whisper model: {e}")
+        
+        try:
+            import whisper
+            import torch
+        except ImportError:
+            print("Warning: Whisper not installed. Speech-to-text will not be available.")
+            return None
+        
+        try:
+            # Small model for faster processing
+            device = "cuda" if torch.cuda.is_available() else "cpu"
+            model = whisper.load_model("base", device=device)
+            self._whisper_device = device
+            return model
+        except Exception as e:
+            print(f"Warning: Could not load Whisper model: {e}")
+            return None
+    
+    def _transcribe(self, audio) -> str:
+        """Run the loaded model on a file path or 16 kHz float32 array."""
+        if self._faster_whisper:
+            segments, _ = self.whisper_model.transcribe(audio, language="en", beam_size=1)
+            return " ".join(segment.text.strip() for segment in segments).strip()
+        
+        result = self.whisper_model.transcribe(
+            audio, language="en", fp16=self._whisper_device == "cuda"
+        )
+        return result["text"].strip()
+    
     def speech_to_text(self, audio_data: bytes) -> str:
         """
         Convert speech audio to text using Whisper.
@@ -64,23 +230,32 @@ class SpeechHandler:
             return "Speech recognition not available. Please type your response."
         
         try:
-            # Save audio to temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as tmp_file:
+            # PCM WAV goes to Whisper as an in-memory array
+            samples = pcm_wav_to_float32(audio_data)
+            if samples is not None:
+                return self._transcribe(samples)
+            
+            # Other formats: save audio to temporary file for ffmpeg decoding
+            with tempfile.NamedTemporaryFile(delete=False, suffix='.wav', dir=_AUDIO_TMP_DIR) as tmp_file:
                 tmp_file.write(audio_data)
                 tmp_path = tmp_file.name
             
-            # Transcribe using Whisper
-            result = self.whisper_model.transcribe(tmp_path, language="en")
-            transcribed_text = result["text"].strip()
-            
-            # Clean up temp file
-            os.unlink(tmp_path)
-            
-            return transcribed_text
+            # Transcribe using Whisper; the temp file sits in RAM on tmpfs,
+            # so remove it even if transcription fails
+            try:
+                return self._transcribe(tmp_path)
+            finally:
+                os.unlink(tmp_path)
         except Exception as e:
             print(f"Error in speech-to-text: {e}")
             return f"Error transcribing audio: {str(e)}"
     
+    async def speech_to_text_async(self, audio_data: bytes) -> str:
+        """Run speech_to_text on the bounded transcription pool, off the event loop."""
+        return await asyncio.get_running_loop().run_in_executor(
+            _STT_POOL, self.speech_to_text, audio_data
+        )
+    
     def text_to_speech(self, text: str) -> bytes:
         """
         Convert text to speech audio.
@@ -91,47 +266,103 @@ class SpeechHandler:
         Returns:
             Audio bytes (WAV format)
         """
-        if not self.tts_engine:
+        if not self.tts_available:
             return b""  # Return empty bytes if TTS not available
         
+        cache_key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+        with self._tts_cache_lock:
+            cached = self._tts_cache.get(cache_key)
+        if cached is not None:
+            return cached
+        
         try:
-            # Save to temporary file
-            with tempfile.NamedTemporaryFile(delete=False, suffix='.wav') as tmp_file:
-                tmp_path = tmp_file.name
-            
-            # Generate speech and save to file
-            self.tts_engine.save_to_file(text, tmp_path)
-            self.tts_engine.runAndWait()
-            
-            # Read the generated audio file
-            with open(tmp_path, 'rb') as f:
-                audio_data = f.read()
+            if self.piper_voice is not None:
+                # Piper writes the WAV straight into memory, no temp file
+                buffer = io.BytesIO()
+                with wave.open(buffer, "wb") as wav_file:
+                    self.piper_voice.synthesize(text, wav_file)
+                audio_data = buffer.getvalue()
+            else:
+                audio_data = self._pyttsx3_to_wav(text)
             
-            # Clean up
-            os.unlink(tmp_path)
+            if audio_data and TTS_CACHE_SIZE > 0:
+                with self._tts_cache_lock:
+                    self._tts_cache[cache_key] = audio_data
             
             return audio_data
         except Exception as e:
             print(f"Error in text-to-speech: {e}")
             return b""
     
+    def _pyttsx3_to_wav(self, text: str) -> bytes:
+        """Synthesize with pyttsx3, which can only render to a file."""
+        # Save to temporary file
+        with tempfile.NamedTemporaryFile(delete=False, suffix='.wav', dir=_AUDIO_TMP_DIR) as tmp_file:
+            tmp_path = tmp_file.name
+        
+        try:
+            # Generate speech and save to file
+            with self._tts_lock:
+                self.tts_engine.save_to_file(text, tmp_path)
+                self.tts_engine.runAndWait()
+            
+            # Read the generated audio file
+            with open(tmp_path, 'rb') as f:
+                return f.read()
+        finally:
+            # Clean up even on failure; on tmpfs a leaked file holds RAM
+            os.unlink(tmp_path)
+    
     def decode_base64_audio(self, base64_string: str) -> bytes:
         """Decode base64 encoded audio string to bytes."""
         try:
-            # Remove data URL prefix if present
-            if ',' in base64_string:
-                try:
-                    parts = base64_string.split(',')
-                    if len(parts) > 1:
-                        base64_string = parts[1]
-                except (IndexError, AttributeError):
-                    # If split fails, use original string
-                    pass
+            # Remove data URL prefix if present (one slice, no split into parts)
+            comma = base64_string.find(',')
+            if comma != -1:
+                base64_string = base64_string[comma + 1:]
             
-            return base64.b64decode(base64_string)
+            # a2b_base64 accepts ASCII str directly, skipping b64decode's
+            # str -> bytes normalization copy
+            return binascii.a2b_base64(base64_string)
         except Exception as e:
             print(f"Error decoding base64 audio: {e}")
             return b""
 
-# Global instance
-speech_handler = SpeechHandler()
+# Shared handler; built once under the lock (the warm-up thread and the
+# first request may race for it)
+_speech_handler: Optional[SpeechHandler] = None
+_speech_handler_lock = threading.Lock()
+
+
+def get_speech_handler() -> SpeechHandler:
+    """
+    Return the shared SpeechHandler, creating it on first use.
+    
+    Construction loads the TTS engine, so it is double-checked under a lock
+    to make sure only one handler (and one pyttsx3/Piper engine) is ever
+    built. Call it from a worker thread, never on the event loop.
+    """
+    global _speech_handler
+    handler = _speech_handler
+    if handler is None:
+        with _speech_handler_lock:
+            handler = _speech_handler
+            if handler is None:
+                handler = _speech_handler = SpeechHandler()
+    return handler
+
+
+def warm_up_in_background() -> threading.Thread:
+    """Create the speech handler and load Whisper on a daemon thread, off the request path."""
+    thread = threading.Thread(
+        target=lambda: get_speech_handler().warm_up(), name="stt-warmup", daemon=True
+    )
+    thread.start()
+    return thread
+
+
+def __getattr__(name: str):
+    """Resolve `speech_handler` lazily on first attribute access (PEP 562)."""
+    if name == "speech_handler":
+        return get_speech_handler()
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
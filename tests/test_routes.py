@@ -0,0 +1,20 @@
+import os
+
+# Keep the app on in-memory sessions and let config load without a real key
+os.environ.pop("REDIS_URL", None)
+os.environ.setdefault("GOOGLE_API_KEY", "test-key")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.main import app  # noqa: E402
+
+# Not used as a context manager, so startup (agent/speech warm-up) is skipped
+client = TestClient(app)
+
+
+def test_active_sessions_route_is_not_shadowed_by_session_id():
+    """/interview/sessions/active must not be matched as /interview/{session_id}."""
+    response = client.get("/api/interview/sessions/active")
+
+    assert response.status_code == 200
+    assert response.json() == {"total_active_sessions": 0, "sessions": []}